@@ -1,69 +1,508 @@
+import time
+
+# Start of module import, for the startup-time breakdown
+IMPORT_STARTED = time.perf_counter()
+
 from http import HTTPStatus
 import io
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+import numpy as np
 import pandas as pd
 import os
-from gensim.models import LdaMulticore
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, jsonify, request, send_file
 from flask_cors import CORS
-from functools import cache
-import kagglehub
-import networkx as nx
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+from functools import lru_cache, wraps
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from array import array
 import pickle
-import nltk
+import tempfile
+import hashlib
+import heapq
+import bisect
+from difflib import SequenceMatcher
+import threading
+import gc
+import signal
+import socket
+import sys
+import uuid
+import zipfile
 import re
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
 import ast
 import json
-from wordcloud import WordCloud
-import matplotlib
 
-matplotlib.use("Agg")  # Use non-interactive backend
-import matplotlib.pyplot as plt
+try:
+    import fcntl
+except ImportError:  # Windows: background tasks only coordinate within a process
+    fcntl = None
 
-import re
+# Heavy modules are imported where they are first used, so a cold start only
+# pays for what the first request needs
+if TYPE_CHECKING:
+    import networkx as nx
+    from gensim.models import LdaMulticore
+    from PIL import ImageFont
+    from scipy.sparse import csr_matrix
 
 app = Flask(__name__)
 CORS(app)
 
 # Global object
 dataset_df: pd.DataFrame = None
-all_authors: nx.MultiGraph = None
-all_topics: dict[str, tuple[LdaMulticore, int, pd.DataFrame]] = {}
+all_authors: "CoauthorGraph" = None
+all_topics: Mapping[str, tuple["LdaMulticore", int, pd.DataFrame]] = {}
+# Dense (documents x topics) float32 distributions, aligned with each group's df
+topic_matrices: dict[str, np.ndarray] = {}
+# Nearest-document index of each group's topic matrix
+topic_indexes: dict[str, "TopicIndex"] = {}
+# Author name -> [(year group, row position in the group's df, paper title)]
+author_papers: dict[str, list[tuple[str, int, str]]] = {}
+# Interned author vocabulary: id -> name and name -> id
+author_names: list[str] = []
+author_ids: dict[str, int] = {}
+# Parsed authors of every paper, as ids into the vocabulary
+dataset_authors: "AuthorLists" = None
+group_authors: dict[str, "AuthorLists"] = {}
+search_index: "SearchIndex" = None
+author_suggester: "AuthorSuggester" = None
+# Author-level aggregates as arrays indexed by author id
+author_paper_counts: np.ndarray = np.zeros(0, dtype=np.int32)
 
 
 def save_pickle(path: str, object: Any):
     path_obj = Path("pickles") / path
     if not path_obj.parent.exists():
-        os.makedirs(path_obj.parent)
+        os.makedirs(path_obj.parent, exist_ok=True)
 
-    with open(path_obj, "wb") as f:
-        pickle.dump(object, f)
+    # Write next to the target and rename over it, so readers in other threads
+    # or processes never see a partially written pickle
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path_obj.parent, prefix=f".{path_obj.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(object, f)
+        os.replace(tmp_path, path_obj)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
 
 
 def load_pickle(path: str) -> Any | None:
+    """
+    Returns None if the pickle is missing or can't be loaded, e.g. when it is
+    truncated or refers to a class under another module name (__main__ when
+    written by python api/index.py), so callers rebuild and overwrite it.
+    """
     path_obj = Path("pickles") / path
-    if path_obj.exists():
+    if not path_obj.exists():
+        return None
+    try:
         with open(path_obj, "rb") as f:
             return pickle.load(f)
-    return None
+    except Exception as e:
+        print(f"Could not load {path_obj}, ignoring it: {e!r}")
+        return None
+
+
+# Source artifacts every derived pickle is computed from
+ARTIFACT_SOURCES = (
+    "pickles/groups/manifest.json",
+    "pickles/graph/indices.npy",
+    "dataset.arrow",
+)
+ARTIFACT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def artifact_fingerprint() -> str:
+    """
+    Fingerprints the source artifacts by path, size and modification time.
+    """
+    digest = hashlib.sha1()
+    for source in ARTIFACT_SOURCES:
+        try:
+            stat = os.stat(source)
+            digest.update(f"{source}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        except OSError:
+            digest.update(f"{source}:missing;".encode())
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Size-bounded in-memory LRU in front of the derived pickles in pickles/.
+    Pickles are stored with the fingerprint of the source artifacts they were
+    computed from; a pickle with a different fingerprint counts as a miss so
+    the caller rebuilds and overwrites it. Values stored with
+    depends_on_sources=False don't get a fingerprint and survive source changes.
+    With max_disk_bytes set, the pickles under the top-level directory of each
+    stored path are also kept under that size, least recently used first.
+    """
+
+    def __init__(self, max_bytes: int, max_disk_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.entries: OrderedDict[str, tuple[str, Any, int]] = OrderedDict()
+        self.total_bytes = 0
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self.lock = threading.Lock()
+
+    def get(
+        self, path: str, keep_in_memory: bool = True, depends_on_sources: bool = True
+    ) -> Any | None:
+        fingerprint = artifact_fingerprint() if depends_on_sources else ""
+
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == fingerprint:
+                self.entries.move_to_end(path)
+                self.stats["hits"] += 1
+                return entry[1]
+
+        stored = load_pickle(path)
+        if not isinstance(stored, dict) or stored.get("fingerprint") != fingerprint:
+            with self.lock:
+                self.stats["misses"] += 1
+            return None
+
+        with self.lock:
+            self.stats["disk_hits"] += 1
+        try:
+            if self.max_disk_bytes is not None:
+                # Mark as recently used for the disk pruning
+                os.utime(Path("pickles") / path)
+            if keep_in_memory:
+                size = (Path("pickles") / path).stat().st_size
+                self._remember(path, fingerprint, stored["value"], size)
+        except OSError:  # pruned by another process meanwhile
+            pass
+        return stored["value"]
+
+    def peek(self, path: str) -> Any | None:
+        """
+        Returns whatever is stored on disk for path, even if it is stale.
+        """
+        stored = load_pickle(path)
+        return stored.get("value") if isinstance(stored, dict) else None
+
+    def put(
+        self,
+        path: str,
+        value: Any,
+        keep_in_memory: bool = True,
+        depends_on_sources: bool = True,
+    ):
+        fingerprint = artifact_fingerprint() if depends_on_sources else ""
+        save_pickle(path, {"fingerprint": fingerprint, "value": value})
+
+        if keep_in_memory:
+            size = (Path("pickles") / path).stat().st_size
+            self._remember(path, fingerprint, value, size)
+        if self.max_disk_bytes is not None:
+            self._prune_disk(Path("pickles") / Path(path).parts[0])
+
+    def _prune_disk(self, directory: Path):
+        files = []
+        for file in directory.rglob("*"):
+            # Skip pickles still being written by save_pickle
+            if file.name.startswith("."):
+                continue
+            try:
+                if file.is_file():
+                    stat = file.stat()
+                    files.append((stat.st_mtime_ns, stat.st_size, file))
+            except OSError:
+                continue
+
+        total = sum(size for _, size, _ in files)
+        for _, size, file in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                file.unlink()
+            except OSError:
+                continue
+            total -= size
+            # Drop directories left empty, so later walks don't visit them
+            if file.parent != directory:
+                try:
+                    file.parent.rmdir()
+                except OSError:  # not empty
+                    pass
+            with self.lock:
+                self.stats["evictions"] += 1
+
+    def _remember(self, path: str, fingerprint: str, value: Any, size: int):
+        if size > self.max_bytes:
+            return
+
+        with self.lock:
+            if (old := self.entries.pop(path, None)) is not None:
+                self.total_bytes -= old[2]
+            self.entries[path] = (fingerprint, value, size)
+            self.total_bytes += size
+
+            while self.total_bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.stats["evictions"] += 1
+
+    def info(self) -> dict:
+        with self.lock:
+            return {
+                **self.stats,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+            }
+
+
+artifact_cache = ArtifactCache(ARTIFACT_CACHE_MAX_BYTES)
+
+
+class BackgroundTask:
+    """
+    Runs a function in a background thread, at most one run at a time, and
+    keeps its progress and the result of the last completed run.
+    The function receives a progress(step, total, message) callback.
+    Runs are also exclusive across processes through a lock file under
+    pickles/tasks/, and the state is published there, so every worker of the
+    production server reports the same run.
+    """
+
+    def __init__(self, name: str, function):
+        self.name = name
+        self.function = function
+        self.state_path = f"tasks/{name}.pkl"
+        self.lock_path = Path("pickles") / "tasks" / f"{name}.lock"
+        self.lock_fd: int | None = None
+        self.lock = threading.Lock()
+        self.status = "idle"
+        self.progress = {"step": 0, "total": 0, "message": ""}
+        self.error: str | None = None
+        self.result: Any = None
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def start(self) -> bool:
+        """Starts a run unless one is already in progress."""
+        with self.lock:
+            if self.status == "running" or not self._lock_processes():
+                return False
+            self.status = "running"
+            self.error = None
+            self.progress = {"step": 0, "total": 0, "message": "Starting"}
+            self.started_at = time.time()
+            self.finished_at = None
+
+        self._publish()
+        threading.Thread(target=self._run, name=self.name, daemon=True).start()
+        return True
+
+    def _lock_processes(self) -> bool:
+        """Takes the lock file; False if another process is running the task."""
+        if fcntl is None:
+            return True
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self.lock_fd = fd
+        return True
+
+    def _unlock_processes(self):
+        if self.lock_fd is not None:
+            fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
+            os.close(self.lock_fd)
+            self.lock_fd = None
+
+    def _report(self, step: int, total: int, message: str):
+        with self.lock:
+            self.progress = {"step": step, "total": total, "message": message}
+        self._publish()
+
+    def _run(self):
+        try:
+            result = self.function(self._report)
+        except Exception as e:
+            with self.lock:
+                self.status = "failed"
+                self.error = str(e)
+                self.finished_at = time.time()
+        else:
+            with self.lock:
+                self.status = "done"
+                self.result = result
+                self.finished_at = time.time()
+        finally:
+            self._publish()
+            self._unlock_processes()
+
+    def _publish(self):
+        save_pickle(self.state_path, self._state())
+
+    def snapshot(self) -> dict:
+        """
+        The state of the run in this process, or else of the last run any
+        process published.
+        """
+        with self.lock:
+            running = self.status == "running"
+        if not running and (published := load_pickle(self.state_path)) is not None:
+            return published
+        return self._state()
+
+    def _state(self) -> dict:
+        with self.lock:
+            return {
+                "name": self.name,
+                "status": self.status,
+                "progress": dict(self.progress),
+                "error": self.error,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class Readiness:
+    """
+    Loads the global state in named stages on first use. A stage runs once,
+    after the stages it requires, and its load time is logged and kept for
+    /api/health. A failed stage is retried by the next caller.
+    """
+
+    def __init__(self):
+        self.stages: dict[str, tuple[Any, tuple[str, ...]]] = {}
+        self.locks: dict[str, threading.Lock] = {}
+        self.status: dict[str, str] = {}
+        self.seconds: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+
+    def add(self, name: str, function, requires: tuple[str, ...] = ()):
+        self.stages[name] = (function, requires)
+        self.locks[name] = threading.Lock()
+        self.status[name] = "pending"
+
+    def ensure(self, *names: str):
+        for name in names:
+            if self.status[name] == "ready":
+                continue
+
+            # Stages only wait on the stages they require, so locks are always
+            # taken in dependency order
+            with self.locks[name]:
+                if self.status[name] == "ready":
+                    continue
+                function, requires = self.stages[name]
+                self.ensure(*requires)
+
+                self.status[name] = "loading"
+                started = time.perf_counter()
+                try:
+                    function()
+                except Exception as e:
+                    self.status[name] = "failed"
+                    self.errors[name] = str(e)
+                    raise
+                self.seconds[name] = time.perf_counter() - started
+                self.errors.pop(name, None)
+                self.status[name] = "ready"
+                print(f"Loaded {name} in {self.seconds[name]:.2f}s")
+
+    def ready(self) -> bool:
+        return all(status == "ready" for status in self.status.values())
+
+    def snapshot(self) -> dict:
+        return {
+            name: {
+                "status": self.status[name],
+                "seconds": self.seconds.get(name),
+                "error": self.errors.get(name),
+            }
+            for name in self.stages
+        }
+
+    def breakdown(self) -> str:
+        return ", ".join(
+            f"{name} {seconds:.2f}s" for name, seconds in self.seconds.items()
+        )
+
+
+readiness = Readiness()
+
+
+class TextPreprocessor:
+    """
+    Holds everything preprocessing needs so it is built once per process:
+    the tokenizer, the stopword set, the compiled cleanup regex and a bounded
+    lemma cache.
+    """
+
+    def __init__(self, lemma_cache_size: int = 100_000):
+        import nltk
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+
+        self.tokenize = nltk.word_tokenize
+        self.stop_words = set(stopwords.words("english"))
+        self.non_alpha = re.compile(r"[^a-z\s]")
+        # Most tokens repeat, so lemmatize each distinct word only once
+        self.lemmatize = lru_cache(maxsize=lemma_cache_size)(
+            WordNetLemmatizer().lemmatize
+        )
+
+    def preprocess(self, text: str) -> list[str]:
+        # Convert to lowercase
+        text = text.lower()
+        # Remove non-alphanumeric characters and tokenize
+        text = self.non_alpha.sub("", text)
+        tokens = self.tokenize(text)
+        # Remove stop words and lemmatize
+        return [self.lemmatize(word) for word in tokens if word not in self.stop_words]
+
+
+_preprocessor: TextPreprocessor | None = None
+
+
+def get_preprocessor() -> TextPreprocessor:
+    global _preprocessor
+    if _preprocessor is None:
+        _preprocessor = TextPreprocessor()
+    return _preprocessor
 
 
 def preprocess_text(text):
-    # Convert to lowercase
-    text = text.lower()
-    # Remove non-alphanumeric characters and tokenize
-    text = re.sub(r"[^a-z\s]", "", text)
-    tokens = nltk.word_tokenize(text)
-    # Remove stop words
-    stop_words = set(stopwords.words("english"))
-    tokens = [word for word in tokens if word not in stop_words]
-    # Lemmatization
-    lemmatizer = WordNetLemmatizer()
-    tokens = [lemmatizer.lemmatize(word) for word in tokens]
-    return tokens
+    return get_preprocessor().preprocess(text)
+
+
+def preprocess_many(texts, workers: int | None = None, chunksize: int = 256):
+    """
+    Preprocesses many documents, yielding token lists in input order.
+    Documents are streamed through a process pool one batch at a time so the
+    whole corpus never has to be held in flight; workers=1 runs in-process.
+    """
+    texts = iter(texts)
+
+    if workers == 1:
+        for text in texts:
+            yield preprocess_text(text)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        batch_size = chunksize * workers
+        while batch := list(islice(texts, batch_size)):
+            yield from pool.map(preprocess_text, batch, chunksize=chunksize)
 
 
 def parse_date(string: str):
@@ -121,857 +560,3457 @@ def parse_authors_field(value):
     return parts
 
 
-def load_dataset():
-    global dataset_df
-    try:
-        if dataset_df is not None:
-            return
+# Uncompressed Arrow IPC file so reads can be memory-mapped column by column
+DATASET_CACHE = "dataset.arrow"
+# Low-cardinality text columns stored dictionary-encoded
+CATEGORICAL_COLUMNS = ("category", "category_code", "published_date", "updated_date")
 
-        if os.path.exists("dataset.pkl"):
-            with open("dataset.pkl", "rb") as f:
-                dataset_df = pickle.load(f)
-                return
-        raise Exception()
-    except:
-        # Download the dataset
-        dataset_path = kagglehub.dataset_download(
-            "sumitm004/arxiv-scientific-research-papers-dataset"
-        )
-
-        # Assuming the downloaded file is a CSV and finding the filename
-        # List files in the downloaded directory
-        files = os.listdir(dataset_path)
-        csv_file = None
-        for file in files:
-            if file.endswith(".csv"):
-                csv_file = file
-                break
 
-        if not csv_file:
-            raise "No CSV file found in the downloaded dataset."
+def optimize_dataset_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stores repeated labels as categoricals and downcasts numeric columns.
+    """
+    df = df.copy()
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    for column in df.select_dtypes(include="integer").columns:
+        df[column] = pd.to_numeric(df[column], downcast="integer")
+    for column in df.select_dtypes(include="float").columns:
+        df[column] = pd.to_numeric(df[column], downcast="float")
+    return df.reset_index(drop=True)
 
-        file_path = os.path.join(dataset_path, csv_file)
-        # Read the dataset into a pandas DataFrame
-        dataset_df = pd.read_csv(file_path)
 
+def save_dataset_cache(df: pd.DataFrame):
+    import pyarrow.feather as feather
 
-def load_author_graph():
-    global all_authors
+    feather.write_feather(df, DATASET_CACHE, compression="uncompressed")
 
-    if (all_authors := load_pickle("graph.pkl")) is None:
-        # Initialize an empty graph
-        G = nx.Graph()
-
-        # Iterate through each row of the DataFrame
-        for _, row in dataset_df.iterrows():
-            authors = parse_authors_field(row.get("authors"))
-
-            # Add nodes for each author
-            for author in authors:
-                G.add_node(author)
-
-            # If a paper has more than one author, add edges between unique pairs
-            if len(authors) > 1:
-                for i in range(len(authors)):
-                    for j in range(i + 1, len(authors)):
-                        author1 = authors[i]
-                        author2 = authors[j]
-                        # Add edge and update weight
-                        if G.has_edge(author1, author2):
-                            G[author1][author2]["weight"] += 1
-                        else:
-                            G.add_edge(author1, author2, weight=1)
-
-        all_authors = G
-        save_pickle("graph.pkl", all_authors)
 
-    return all_authors
+def read_dataset_cache(columns: list[str] | None = None) -> pd.DataFrame:
+    import pyarrow as pa
+    import pyarrow.feather as feather
 
+    if columns is not None:
+        # Only project columns the cache actually has
+        available = set(pa.ipc.open_file(DATASET_CACHE).schema.names)
+        columns = [column for column in columns if column in available]
+    table = feather.read_table(DATASET_CACHE, columns=columns, memory_map=True)
+    return table.to_pandas(split_blocks=True)
 
-def load_topics():
-    global all_topics
-    all_topics = load_pickle("all_lda_models.pkl")
 
+def download_dataset() -> pd.DataFrame:
+    import kagglehub
 
-@app.route("/api/health")
-def health():
-    """
-    Checks the health of the API.
-    """
-    return jsonify({"status": "ok"})
+    # Download the dataset
+    dataset_path = kagglehub.dataset_download(
+        "sumitm004/arxiv-scientific-research-papers-dataset"
+    )
 
+    # Assuming the downloaded file is a CSV and finding the filename
+    # List files in the downloaded directory
+    files = os.listdir(dataset_path)
+    csv_file = None
+    for file in files:
+        if file.endswith(".csv"):
+            csv_file = file
+            break
 
-@app.route("/api/corpus-overview")
-def corpus_overview():
+    if not csv_file:
+        raise FileNotFoundError("No CSV file found in the downloaded dataset.")
+
+    file_path = os.path.join(dataset_path, csv_file)
+    # Read the dataset into a pandas DataFrame
+    return pd.read_csv(file_path)
+
+
+def load_dataset(columns: list[str] | None = None):
     """
-    Returns the corpus overview.
+    Loads the dataset from the columnar cache, reading only the given columns.
+    The cache is created from a legacy dataset.pkl or the Kaggle CSV if missing.
     """
-    total_documents = sum(len(df) for _, _, df in all_topics.values())
-    total_topics = sum(num_topics for _, num_topics, _ in all_topics.values())
-    overview = {
-        "total_documents": total_documents,
-        "total_authors": all_authors.number_of_nodes(),
-        "total_topics": total_topics,
-        "total_connections": all_authors.number_of_edges(),
-    }
-    return jsonify(overview)
+    global dataset_df
 
+    if dataset_df is not None:
+        return
 
-@app.route("/api/corpus-documents")
-@cache
-def corpus_documents():
+    if not os.path.exists(DATASET_CACHE):
+        df = None
+        if os.path.exists("dataset.pkl"):
+            try:
+                with open("dataset.pkl", "rb") as f:
+                    df = pickle.load(f)
+            except Exception:
+                df = None
+        if df is None:
+            df = download_dataset()
+        save_dataset_cache(optimize_dataset_dtypes(df))
+
+    dataset_df = read_dataset_cache(columns)
+
+
+class AuthorLists:
     """
-    Returns the corpus documents with their topics.
+    The authors of every paper in a DataFrame, in ragged (offset) form: the
+    author ids of paper i are ids[offsets[i]:offsets[i + 1]].
     """
 
-    print("Loading api/corpus-documents")
-    if (to_return := load_pickle("corpus_documents.pkl")) is None:
-        to_return = []
+    def __init__(self, offsets: np.ndarray, ids: np.ndarray):
+        self.offsets = offsets
+        self.ids = ids
 
-        # Iterate through all topics to get documents with their dominant topics
-        for group_name, (model, num_topics, df) in all_topics.items():
-            for _, row in df.iterrows():
-                # Get dominant topic for this document if processed_summary exists
-                topics_str = ""
-
-                if "processed_summary" in df.columns and row.get("processed_summary"):
-                    bow = model.id2word.doc2bow(row["processed_summary"])
-                    topic_distribution = model.get_document_topics(bow)
-
-                    if topic_distribution:
-                        # Get top 3 topics for this document
-                        top_topics = sorted(
-                            topic_distribution, key=lambda x: x[1], reverse=True
-                        )[:3]
-                        topic_keywords = []
-                        for topic_id, prob in top_topics:
-                            # Get top 5 words for this topic
-                            words = [
-                                word for word, _ in model.show_topic(topic_id, topn=3)
-                            ]
-                            topic_keywords.append(f"{', '.join(words)} ({prob:.2f})")
-                        topics_str = " | ".join(topic_keywords)
+    def __len__(self):
+        return len(self.offsets) - 1
 
-                to_return.append(
-                    {
-                        "title": row["title"],
-                        "authors": parse_authors_field(row.get("authors")),
-                        "publicationYear": (
-                            parse_date(row["published_date"])[2]
-                            if "published_date" in row
-                            else group_name.split("-")[0]
-                        ),
-                        "topics": topics_str,
-                    }
-                )
+    def ids_of(self, pos: int) -> np.ndarray:
+        return self.ids[self.offsets[pos] : self.offsets[pos + 1]]
 
-        save_pickle("corpus_documents.pkl", to_return)
+    def names_of(self, pos: int) -> list[str]:
+        return [author_names[i] for i in self.ids_of(pos)]
 
-    return jsonify(to_return), 200
+    def papers(self) -> np.ndarray:
+        """Returns the paper position of every entry in ids."""
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
 
 
-@app.route("/api/topic-count-per-group")
-def topic_count_per_group():
+def intern_authors(column) -> AuthorLists:
     """
-    Returns the topic count per group.
+    Parses an authors column exactly once and interns every name into the
+    shared author vocabulary.
     """
-    result = [
-        {"group": group_name, "topic_count": num_topics}
-        for group_name, (_, num_topics, _) in all_topics.items()
-    ]
+    column = pd.Series(column).reset_index(drop=True)
+    exploded = column.map(parse_authors_field).explode().dropna()
 
-    print(result)
+    # Map each distinct name to a vocabulary id, adding new names at the end
+    codes, uniques = pd.factorize(exploded, sort=False)
+    vocab_ids = np.empty(len(uniques), dtype=np.int32)
+    for i, name in enumerate(uniques):
+        if (author_id := author_ids.get(name)) is None:
+            author_id = author_ids[name] = len(author_names)
+            author_names.append(name)
+        vocab_ids[i] = author_id
 
-    return jsonify(result)
+    counts = np.bincount(exploded.index.to_numpy(), minlength=len(column))
+    offsets = np.zeros(len(column) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return AuthorLists(offsets, vocab_ids[codes])
 
 
-@app.route("/api/trending-topics-per-group")
-def trending_topics_per_group():
+def empty_author_lists(length: int) -> AuthorLists:
+    return AuthorLists(np.zeros(length + 1, dtype=np.int64), np.zeros(0, np.int32))
+
+
+def load_author_lists():
     """
-    Returns the trending topics per year with top keywords.
-    Vectorized version for better performance.
+    Normalizes the authors field of the dataset and of every year group.
+    The dataset is interned first, so its authors take ids in first-seen order.
     """
+    global author_names, author_ids, dataset_authors, group_authors
+    author_names = []
+    author_ids = {}
+
+    if dataset_df is not None and "authors" in dataset_df.columns:
+        dataset_authors = intern_authors(dataset_df["authors"])
+    else:
+        dataset_authors = empty_author_lists(
+            len(dataset_df) if dataset_df is not None else 0
+        )
 
-    if (result := load_pickle("trending_topics_per_group.pkl")) is None:
-        result = []
-        for group_name, (model, num_topics, df) in all_topics.items():
-            # Get all topics for this year group
-            topics_data = []
-
-            # Vectorized computation: process all documents at once
-            if "processed_summary" in df.columns:
-                # Get dominant topics for all documents at once
-                def get_dominant_topic(summary):
-                    if not summary:
-                        return -1
-                    bow = model.id2word.doc2bow(summary)
-                    if not bow:
-                        return -1
-                    doc_topics = model.get_document_topics(bow)
-                    if doc_topics:
-                        return max(doc_topics, key=lambda x: x[1])[0]
-                    return -1
-
-                # Vectorized operation using pandas apply
-                valid_summaries = df["processed_summary"].notna()
-                dominant_topics = df[valid_summaries]["processed_summary"].apply(
-                    get_dominant_topic
-                )
+    group_authors = {}
+    for group_name, (model, num_topics, df) in all_topics.items():
+        if "authors" in df.columns:
+            group_authors[group_name] = intern_authors(df["authors"])
+        else:
+            group_authors[group_name] = empty_author_lists(len(df))
 
-                # Count documents per topic using value_counts
-                topic_counts = (
-                    dominant_topics[dominant_topics >= 0].value_counts().to_dict()
-                )
-            else:
-                topic_counts = {}
 
-            for topic_id in range(num_topics):
-                # Get top 10 words for this topic
-                top_words = model.show_topic(topic_id, topn=10)
-                keywords = [
-                    {"word": word, "weight": float(weight)}
-                    for word, weight in top_words
-                ]
+def count_coauthor_pairs(papers: np.ndarray, authors: np.ndarray) -> pd.DataFrame:
+    """
+    Counts co-authorship pairs from an exploded (paper, author id) listing.
+    Pairs are unordered (smaller id first) and kept in first-seen order.
+    """
+    exploded = pd.DataFrame(
+        {"paper": papers, "author": authors, "pos": np.arange(len(papers))}
+    )
 
-                # Get document count from precomputed counts
-                topic_count = topic_counts.get(topic_id, 0)
+    # Every (earlier author, later author) combination within a paper
+    pairs = exploded.merge(exploded, on="paper")
+    pairs = pairs[pairs["pos_x"] < pairs["pos_y"]]
+    pairs = pairs.sort_values(["pos_x", "pos_y"], kind="stable")
+
+    a = pairs["author_x"].to_numpy()
+    b = pairs["author_y"].to_numpy()
+    return (
+        pd.DataFrame({"a": np.minimum(a, b), "b": np.maximum(a, b)})
+        .groupby(["a", "b"], sort=False)
+        .size()
+        .rename("weight")
+        .reset_index()
+    )
 
-                topics_data.append(
-                    {
-                        "topic_id": topic_id,
-                        "keywords": keywords,
-                        "document_count": topic_count,
-                    }
-                )
 
-            # Sort by document count to get "trending" topics
-            topics_data.sort(key=lambda x: x["document_count"], reverse=True)
+GRAPH_DIR = Path("pickles") / "graph"
+GRAPH_ARRAYS = ("indptr", "indices", "weights", "name_offsets", "name_bytes")
 
-            result.append(
-                {
-                    "group": group_name,
-                    "topics": topics_data[:5],  # Return top 5 trending topics
-                }
-            )
-        save_pickle("trending_topics_per_group.pkl", result)
 
-    return jsonify(result)
+class CoauthorGraph:
+    """
+    Weighted co-authorship graph over integer node ids.
+    Node names are interned in a list; the adjacency is CSR (indptr, indices,
+    weights) with every row sorted by edge weight, strongest first, and each
+    undirected edge stored in both rows (self-loops once).
+    """
 
+    def __init__(
+        self,
+        names: list[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+    ):
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self._edges = None
+
+    @classmethod
+    def from_edges(
+        cls, names: list[str], u: np.ndarray, v: np.ndarray, weight: np.ndarray
+    ) -> "CoauthorGraph":
+        loops = u == v
+        src = np.concatenate([u, v[~loops]])
+        dst = np.concatenate([v, u[~loops]])
+        weight = np.concatenate([weight, weight[~loops]])
+        order = np.lexsort((-weight, src))
+        return cls(
+            names,
+            np.searchsorted(src[order], np.arange(len(names) + 1)).astype(np.int64),
+            dst[order].astype(np.int32),
+            weight[order].astype(np.int32),
+        )
 
-@app.route("/api/corpus-topics")
-def corpus_topics():
-    topics_by_group = []
+    @classmethod
+    def from_networkx(cls, graph: "nx.Graph") -> "CoauthorGraph":
+        names = [str(name) for name in graph.nodes()]
+        positions = {name: i for i, name in enumerate(graph.nodes())}
+        edges = graph.number_of_edges()
+        return cls.from_edges(
+            names,
+            np.fromiter((positions[u] for u, _ in graph.edges()), np.int32, edges),
+            np.fromiter((positions[v] for _, v in graph.edges()), np.int32, edges),
+            np.fromiter(
+                (w for _, _, w in graph.edges(data="weight", default=1)),
+                np.int32,
+                edges,
+            ),
+        )
 
-    for group_name, (model, num_topics, df) in all_topics.items():
-        topics_by_group.append(
-            {"group_name": group_name, "topics": num_topics, "total_documents": len(df)}
+    def to_networkx(self) -> "nx.Graph":
+        """
+        Materializes the graph as a networkx.Graph, for algorithms and exports
+        that need one. Costs far more memory than the arrays.
+        """
+        import networkx as nx
+
+        u, v, weight = self.edges()
+        names = np.array(self.names, dtype=object)
+        graph = nx.Graph()
+        graph.add_nodes_from(self.names)
+        graph.add_weighted_edges_from(zip(names[u], names[v], weight.tolist()))
+        return graph
+
+    def to_csr_matrix(self) -> "csr_matrix":
+        from scipy.sparse import csr_matrix
+
+        n = len(self.names)
+        return csr_matrix((self.weights, self.indices, self.indptr), shape=(n, n))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def number_of_nodes(self) -> int:
+        return len(self.names)
+
+    def number_of_edges(self) -> int:
+        return len(self.edges()[0])
+
+    def edges(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns every undirected edge once as (u, v, weight) arrays with u <= v.
+        """
+        if self._edges is None:
+            rows = np.repeat(
+                np.arange(len(self.names), dtype=np.int32), np.diff(self.indptr)
+            )
+            keep = rows <= self.indices
+            self._edges = (rows[keep], self.indices[keep], self.weights[keep])
+        return self._edges
+
+    def degrees(self, weighted: bool = False) -> np.ndarray:
+        """
+        Returns the (weighted) degree of every node; self-loops count twice,
+        as in networkx.
+        """
+        n = len(self.names)
+        u, v, weight = self.edges()
+        values = weight.astype(np.int64) if weighted else np.ones(len(u), np.int64)
+        return np.bincount(u, values, minlength=n).astype(np.int64) + np.bincount(
+            v, values, minlength=n
+        ).astype(np.int64)
+
+    def neighbors(self, name: str, limit: int | None = None) -> list[tuple[str, int]]:
+        """
+        Returns (neighbor, weight) pairs of a node, strongest first.
+        """
+        i = self.ids[name]
+        lo = self.indptr[i]
+        hi = (
+            self.indptr[i + 1] if limit is None else min(self.indptr[i + 1], lo + limit)
         )
+        return [
+            (self.names[j], int(w))
+            for j, w in zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist())
+        ]
+
+    def save(self, directory: Path = GRAPH_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+        encoded = [name.encode("utf-8") for name in self.names]
+        arrays = {
+            "indptr": np.asarray(self.indptr),
+            "indices": np.asarray(self.indices),
+            "weights": np.asarray(self.weights),
+            "name_offsets": np.cumsum([0] + [len(name) for name in encoded]),
+            "name_bytes": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        }
+        for key, values in arrays.items():
+            np.save(directory / f"{key}.npy", values)
+
+    @classmethod
+    def load(cls, directory: Path = GRAPH_DIR) -> "CoauthorGraph | None":
+        """
+        Loads a saved graph, memory-mapping the adjacency arrays.
+        """
+        if not all((directory / f"{key}.npy").exists() for key in GRAPH_ARRAYS):
+            return None
 
-    return jsonify(topics_by_group)
+        arrays = {
+            key: np.load(directory / f"{key}.npy", mmap_mode="r")
+            for key in GRAPH_ARRAYS
+        }
+        blob = arrays["name_bytes"].tobytes()
+        offsets = arrays["name_offsets"].tolist()
+        names = [
+            blob[lo:hi].decode("utf-8") for lo, hi in zip(offsets[:-1], offsets[1:])
+        ]
+        return cls(names, arrays["indptr"], arrays["indices"], arrays["weights"])
 
 
-@app.route("/api/corpus-topics/<year_group>", methods=["GET"])
-def corpus_topics_detail(year_group):
+def build_author_graph(authors: AuthorLists, workers: int = 1) -> CoauthorGraph:
     """
-    Returns detailed topics with documents and coherence scores for a specific year group.
-    Schema: [{"topic": string, "documents": [{"title": string}], "coherence": number}]
+    Builds the weighted co-authorship graph from interned author lists.
+    With workers > 1 the pair counting is sharded by paper across a process
+    pool and the partial counts are merged before the graph is materialized.
     """
+    papers = authors.papers()
+    codes = authors.ids
 
-    # Find the model and data for the specified year group
-    if year_group not in all_topics:
-        return (
-            jsonify({"error": f"Year group '{year_group}' not found"}),
-            HTTPStatus.NOT_FOUND,
+    if workers > 1 and len(papers) > 0:
+        # Shard on paper boundaries so no paper is split across workers
+        bounds = np.searchsorted(
+            papers, np.linspace(papers[0], papers[-1] + 1, workers + 1)
+        )
+        shards = [
+            (papers[lo:hi], codes[lo:hi])
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+            if hi > lo
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(count_coauthor_pairs, *zip(*shards)))
+        counts = (
+            pd.concat(counts, ignore_index=True)
+            .groupby(["a", "b"], sort=False)["weight"]
+            .sum()
+            .reset_index()
         )
+    else:
+        counts = count_coauthor_pairs(papers, codes)
+
+    # Ids are handed out in first-seen order, so nodes keep that order too
+    nodes = np.unique(codes)
+    return CoauthorGraph.from_edges(
+        [author_names[i] for i in nodes.tolist()],
+        np.searchsorted(nodes, counts["a"].to_numpy()).astype(np.int32),
+        np.searchsorted(nodes, counts["b"].to_numpy()).astype(np.int32),
+        counts["weight"].to_numpy(),
+    )
 
-    if (to_return := load_pickle(f"corpus_topics/{year_group}.pkl")) is None:
-        model, num_topics, df = all_topics[year_group]
-        to_return = []
-        # Vectorized computation: process all documents at once to find dominant topics
-        if "processed_summary" in df.columns:
-            # Get dominant topic and confidence for all documents
-            def get_dominant_topic_with_confidence(summary):
-                if not summary:
-                    return -1, 0.0
-                bow = model.id2word.doc2bow(summary)
-                if not bow:
-                    return -1, 0.0
-                doc_topics = model.get_document_topics(bow)
-                if doc_topics:
-                    # Get the topic with highest probability
-                    dominant = max(doc_topics, key=lambda x: x[1])
-                    return dominant[0], dominant[1]  # topic_id, confidence
-                return -1, 0.0
-
-            valid_summaries = df["processed_summary"].notna()
-            df_copy = df[valid_summaries].copy()
-
-            # Apply function to get both topic and confidence
-            topic_confidence = df_copy["processed_summary"].apply(
-                get_dominant_topic_with_confidence
-            )
-            df_copy["dominant_topic"] = topic_confidence.apply(lambda x: x[0])
-            df_copy["topic_confidence"] = topic_confidence.apply(lambda x: x[1])
 
-            # Group documents by dominant topic
-            for topic_id in range(num_topics):
-                # Get top words for this topic to create the topic label
-                topic_words = model.show_topic(topic_id, topn=3)
-                topic_label = ", ".join([word for word, _ in topic_words])
+def load_author_graph(workers: int = 1):
+    """
+    Loads the co-author graph from pickles/graph/, converting a legacy
+    networkx graph.pkl or building it from the dataset when it is missing.
+    """
+    global all_authors
+
+    if (all_authors := CoauthorGraph.load()) is None:
+        if (legacy := load_pickle("graph.pkl")) is not None:
+            all_authors = CoauthorGraph.from_networkx(legacy)
+        else:
+            readiness.ensure("authors")
+            all_authors = build_author_graph(dataset_authors, workers=workers)
+        all_authors.save()
+        # Reopen so the adjacency is memory-mapped rather than held in memory
+        all_authors = CoauthorGraph.load()
 
-                # Get documents where this is the dominant topic
-                topic_docs = df_copy[df_copy["dominant_topic"] == topic_id]
+    return all_authors
 
-                # Sort by confidence score and limit to top 10 documents
-                topic_docs = topic_docs.sort_values("topic_confidence", ascending=False)
 
-                documents = []
-                for _, row in topic_docs.head(10).iterrows():
-                    documents.append(
-                        {
-                            "title": row.get("title", "Unknown"),
-                            "confidence": float(row["topic_confidence"]),
-                        }
+def load_author_index():
+    global author_papers
+
+    if (
+        author_papers := artifact_cache.get("author_papers.pkl", keep_in_memory=False)
+    ) is None:
+        author_papers = {}
+
+        for group_name, (model, num_topics, df) in all_topics.items():
+            if "authors" not in df.columns or "title" not in df.columns:
+                continue
+
+            authors = group_authors[group_name]
+            for pos, title in enumerate(df["title"]):
+                for author in authors.names_of(pos):
+                    author_papers.setdefault(author, []).append(
+                        (group_name, pos, title)
                     )
 
-                to_return.append({"topic": topic_label, "documents": documents})
-        save_pickle(f"corpus_topics/{year_group}.pkl", to_return)
+        artifact_cache.put("author_papers.pkl", author_papers, keep_in_memory=False)
 
-    return jsonify(to_return)
+    return author_papers
 
 
-@app.route("/api/author-networks", methods=["POST"])
-def author_networks():
+def build_author_stats():
     """
-    Returns the author networks showing collaborations.
+    Computes paper counts for every interned author.
+    Must be rerun whenever the topic DataFrames change.
     """
-    data = request.get_json()
-    author_name = data.get("author_name", "")
+    global author_paper_counts
 
-    if not author_name:
-        return jsonify({"nodes": [], "links": []}), 200
+    # Paper counts straight from the interned ids of every group
+    group_ids = [authors.ids for authors in group_authors.values()]
+    author_paper_counts = np.bincount(
+        np.concatenate(group_ids) if group_ids else np.zeros(0, dtype=np.int32),
+        minlength=len(author_names),
+    ).astype(np.int32)
 
-    nodes = []
-    links = []
-    added_nodes = set()
-    added_links = set()
 
-    # Check if author exists in the graph
-    if author_name not in all_authors:
-        return jsonify({"nodes": [], "links": [], "message": "Author not found"}), 200
+def get_author_paper_count(author: str) -> int:
+    i = author_ids.get(author)
+    return int(author_paper_counts[i]) if i is not None else 0
 
-    # Add the main author node
-    nodes.append({"id": author_name, "group": "author"})
-    added_nodes.add(author_name)
 
-    # Get all neighbors (co-authors) from the graph
-    neighbors = list(all_authors.neighbors(author_name))
+# (graph, arrays) so the arrays are rebuilt if the graph object is replaced
+_graph_arrays: tuple[CoauthorGraph, dict[str, Any]] | None = None
 
-    # Add co-author nodes and links
-    for co_author in neighbors[:50]:  # Limit to top 50 co-authors
-        if co_author not in added_nodes:
-            # Get the collaboration weight
-            weight = all_authors[author_name][co_author]["weight"]
-            nodes.append({"id": co_author, "group": "co-author", "weight": weight})
-            added_nodes.add(co_author)
 
-        link_key = tuple(sorted([author_name, co_author]))
-        if link_key not in added_links:
-            weight = all_authors[author_name][co_author]["weight"]
-            links.append({"source": author_name, "target": co_author, "value": weight})
-            added_links.add(link_key)
+def graph_arrays() -> dict[str, Any]:
+    """
+    Returns the co-author graph as arrays in graph node order: names, weighted
+    degrees, paper counts, the edge list (u, v, weight) as node positions and
+    the CSR adjacency with every row sorted strongest first.
+    """
+    global _graph_arrays
+
+    if _graph_arrays is not None and _graph_arrays[0] is all_authors:
+        return _graph_arrays[1]
+
+    u, v, weight = all_authors.edges()
+    arrays = {
+        "names": all_authors.names,
+        "positions": all_authors.ids,
+        "weighted_degree": all_authors.degrees(weighted=True),
+        "paper_count": np.array(
+            [get_author_paper_count(name) for name in all_authors.names],
+            dtype=np.int32,
+        ),
+        "u": u,
+        "v": v,
+        "weight": weight,
+        "indptr": all_authors.indptr,
+        "indices": all_authors.indices,
+        "weights": all_authors.weights,
+    }
 
-    # Add papers by searching through all_topics
-    for group_name, (model, num_topics, df) in all_topics.items():
-        if "authors" in df.columns and "title" in df.columns:
-            for _, doc in df.iterrows():
-                authors_list = parse_authors_field(doc.get("authors"))
-                if author_name in authors_list:
-                    # Add paper node
-                    paper_id = doc.get("title", "Unknown")
-                    if paper_id not in added_nodes:
-                        nodes.append(
-                            {"id": paper_id, "group": "paper", "year": group_name}
-                        )
-                        added_nodes.add(paper_id)
-
-                    # Link author to paper
-                    link_key = (author_name, paper_id)
-                    if link_key not in added_links:
-                        links.append(
-                            {"source": author_name, "target": paper_id, "value": 1}
-                        )
-                        added_links.add(link_key)
-
-                    # Link co-authors to the same paper
-                    for co_author in authors_list:
-                        if co_author != author_name and co_author in added_nodes:
-                            link_key = (co_author, paper_id)
-                            if link_key not in added_links:
-                                links.append(
-                                    {
-                                        "source": co_author,
-                                        "target": paper_id,
-                                        "value": 1,
-                                    }
-                                )
-                                added_links.add(link_key)
+    _graph_arrays = (all_authors, arrays)
+    return arrays
 
-    response = {
-        "nodes": nodes,
-        "links": links,
-        "statistics": {
+
+def strongest_coauthors(author: str, limit: int) -> list[tuple[str, int]]:
+    """
+    Returns up to limit (co-author, weight) pairs, strongest collaboration first.
+    """
+    return all_authors.neighbors(author, limit)
+
+
+def ego_network(
+    author: str, depth: int, fanout: int, max_nodes: int, max_links: int
+) -> dict:
+    """
+    Breadth-first expansion around an author over the CSR adjacency.
+    Each frontier node contributes its fanout strongest collaborators; new
+    nodes of a hop are admitted strongest link first until max_nodes is hit.
+    Links are the strongest edges among all admitted nodes.
+    """
+    arrays = graph_arrays()
+    names, indptr = arrays["names"], arrays["indptr"]
+    indices, weights = arrays["indices"], arrays["weights"]
+
+    center = arrays["positions"][author]
+    hops = {center: 0}
+    frontier = [center]
+
+    for hop in range(1, depth + 1):
+        candidates = []
+        for node in frontier:
+            lo = indptr[node]
+            hi = min(indptr[node + 1], lo + fanout)
+            candidates.append((weights[lo:hi], indices[lo:hi]))
+        if not candidates:
+            break
+
+        cand_weights = np.concatenate([w for w, _ in candidates])
+        cand_nodes = np.concatenate([n for _, n in candidates])
+        frontier = []
+        for i in np.argsort(-cand_weights, kind="stable").tolist():
+            if len(hops) >= max_nodes:
+                break
+            node = int(cand_nodes[i])
+            if node not in hops:
+                hops[node] = hop
+                frontier.append(node)
+
+    # Strongest links among the admitted nodes
+    members = np.fromiter(hops.keys(), dtype=np.int64, count=len(hops))
+    included = np.zeros(len(names), dtype=bool)
+    included[members] = True
+    rows = [
+        (
+            node,
+            indices[indptr[node] : indptr[node + 1]],
+            weights[indptr[node] : indptr[node + 1]],
+        )
+        for node in members.tolist()
+    ]
+    link_src = np.concatenate([np.full(len(n), node) for node, n, _ in rows])
+    link_dst = np.concatenate([n for _, n, _ in rows])
+    link_weight = np.concatenate([w for _, _, w in rows])
+    keep = included[link_dst] & (link_src < link_dst)
+    link_src, link_dst, link_weight = link_src[keep], link_dst[keep], link_weight[keep]
+    strongest = top_k_indices(link_weight, max_links)
+
+    nodes = [
+        {
+            "id": names[node],
+            "group": "author" if hop == 0 else "co-author" if hop == 1 else "extended",
+            "hop": hop,
+            "weight": int(arrays["weighted_degree"][node]),
+            "paper_count": int(arrays["paper_count"][node]),
+        }
+        for node, hop in hops.items()
+    ]
+    links = [
+        {"source": names[a], "target": names[b], "value": int(w)}
+        for a, b, w in zip(
+            link_src[strongest].tolist(),
+            link_dst[strongest].tolist(),
+            link_weight[strongest].tolist(),
+        )
+    ]
+
+    return {
+        "nodes": nodes,
+        "links": links,
+        "statistics": {
+            "nodes": len(nodes),
+            "links": len(links),
+            "depth": max(hops.values()),
+        },
+    }
+
+
+GROUPS_DIR = Path("pickles") / "groups"
+GROUP_MANIFEST = GROUPS_DIR / "manifest.json"
+LEGACY_TOPICS = Path("pickles") / "all_lda_models.pkl"
+TOPIC_GROUPS_MAX_BYTES = int(os.environ.get("TOPIC_GROUPS_MAX_BYTES", 2 * 1024**3))
+
+
+def document_summaries(df: pd.DataFrame):
+    if "processed_summary" in df.columns:
+        return df["processed_summary"]
+    return [None] * len(df)
+
+
+def save_topic_group(
+    group_name: str, model: "LdaMulticore", num_topics: int, df: pd.DataFrame
+) -> dict:
+    """
+    Writes one year group as its own artifact under pickles/groups/<group>/:
+    the gensim model with every array in its own .npy, the DataFrame as an
+    Arrow file (pickled if a column can't be converted) and the topic matrix.
+    Returns the group's manifest entry.
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    directory = GROUPS_DIR / group_name
+    directory.mkdir(parents=True, exist_ok=True)
+
+    # sep_limit=0 stores every array separately so all of them can be mmap'd
+    model.save(str(directory / "model"), sep_limit=0)
+    try:
+        feather.write_feather(
+            df, directory / "documents.arrow", compression="uncompressed"
+        )
+    except pa.ArrowException:
+        (directory / "documents.arrow").unlink(missing_ok=True)
+        with open(directory / "documents.pkl", "wb") as f:
+            pickle.dump(df, f)
+    np.save(
+        directory / "topic_matrix.npy",
+        infer_topic_matrix(model, num_topics, document_summaries(df)),
+    )
+
+    return {"num_topics": num_topics, "documents": len(df)}
+
+
+def load_topic_group(group_name: str, num_topics: int) -> tuple[tuple, int]:
+    """
+    Reads one year group with its model arrays memory-mapped. Returns the
+    (model, num_topics, df) entry and an estimate of its resident bytes.
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    from gensim.models import LdaModel
+
+    directory = GROUPS_DIR / group_name
+    model = LdaModel.load(str(directory / "model"), mmap="r")
+
+    if (directory / "documents.arrow").exists():
+        table = feather.read_table(directory / "documents.arrow", memory_map=True)
+        df = table.to_pandas()
+        # Arrow hands list columns back as arrays; the rest of the code expects lists
+        for field in table.schema:
+            if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+                df[field.name] = [
+                    value.tolist() if isinstance(value, np.ndarray) else value
+                    for value in df[field.name]
+                ]
+    else:
+        with open(directory / "documents.pkl", "rb") as f:
+            df = pickle.load(f)
+
+    # Memory-mapped arrays live in the page cache, so only count the others
+    arrays = [*vars(model).values(), *vars(model.state).values()]
+    size = int(df.memory_usage(deep=True).sum()) + sum(
+        array.nbytes
+        for array in arrays
+        if isinstance(array, np.ndarray) and not isinstance(array, np.memmap)
+    )
+    return (model, num_topics, df), size
+
+
+class TopicGroups(Mapping):
+    """
+    Year group -> (model, num_topics, df), read from pickles/groups/ on first
+    access. Loaded groups are kept in an LRU and the least recently used are
+    dropped once their estimated resident size exceeds max_bytes. Topic and
+    document counts come from the manifest without loading anything.
+    """
+
+    def __init__(self, manifest: dict[str, dict], max_bytes: int):
+        self.manifest = manifest
+        self.max_bytes = max_bytes
+        self.loaded: OrderedDict[str, tuple[tuple, int]] = OrderedDict()
+        self.total_bytes = 0
+        self.stats = {"hits": 0, "loads": 0, "evictions": 0}
+        self.lock = threading.Lock()
+        # Held while a group loads, so only requests for that group wait
+        self.load_locks = {group_name: threading.Lock() for group_name in manifest}
+
+    def __getitem__(self, group_name: str) -> tuple["LdaMulticore", int, pd.DataFrame]:
+        if group_name not in self.manifest:
+            raise KeyError(group_name)
+
+        if (group := self._hit(group_name)) is not None:
+            return group
+
+        with self.load_locks[group_name]:
+            # Another request may have loaded it while this one waited
+            if (group := self._hit(group_name)) is not None:
+                return group
+            group, size = load_topic_group(group_name, self.num_topics(group_name))
+
+            with self.lock:
+                self.stats["loads"] += 1
+                self.loaded[group_name] = (group, size)
+                self.total_bytes += size
+
+                # Always keep the group just loaded, even if it alone is over budget
+                while self.total_bytes > self.max_bytes and len(self.loaded) > 1:
+                    _, (_, evicted_size) = self.loaded.popitem(last=False)
+                    self.total_bytes -= evicted_size
+                    self.stats["evictions"] += 1
+
+        return group
+
+    def _hit(self, group_name: str):
+        with self.lock:
+            if (entry := self.loaded.get(group_name)) is None:
+                return None
+            self.loaded.move_to_end(group_name)
+            self.stats["hits"] += 1
+            return entry[0]
+
+    def __contains__(self, group_name) -> bool:
+        return group_name in self.manifest
+
+    def __iter__(self):
+        return iter(self.manifest)
+
+    def __len__(self) -> int:
+        return len(self.manifest)
+
+    def num_topics(self, group_name: str) -> int:
+        return self.manifest[group_name]["num_topics"]
+
+    def num_documents(self, group_name: str) -> int:
+        return self.manifest[group_name]["documents"]
+
+    def info(self) -> dict:
+        with self.lock:
+            return {
+                **self.stats,
+                "loaded": list(self.loaded),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def split_legacy_topics() -> dict[str, dict]:
+    """
+    Splits a legacy all_lda_models.pkl into per-group artifacts and writes the
+    manifest. The legacy pickle has to fit in memory this one time.
+    Raises FileNotFoundError without it, so the stage fails and is retried
+    rather than persisting an empty corpus.
+    """
+    if (legacy := load_pickle(LEGACY_TOPICS.name)) is None:
+        raise FileNotFoundError(f"{LEGACY_TOPICS} is missing or unreadable")
+
+    manifest = {
+        group_name: save_topic_group(group_name, model, num_topics, df)
+        for group_name, (model, num_topics, df) in legacy.items()
+    }
+
+    # The manifest goes last and atomically, so an interrupted split reruns
+    GROUPS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = GROUP_MANIFEST.with_name(f".{GROUP_MANIFEST.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, GROUP_MANIFEST)
+    return manifest
+
+
+def load_topics():
+    """
+    Opens the per-group topic artifacts, splitting the legacy
+    all_lda_models.pkl on first start or whenever it is replaced by a newer
+    one. Groups themselves load on first access.
+    """
+    global all_topics
+
+    if GROUP_MANIFEST.exists() and (
+        not LEGACY_TOPICS.exists()
+        or LEGACY_TOPICS.stat().st_mtime_ns <= GROUP_MANIFEST.stat().st_mtime_ns
+    ):
+        manifest = json.loads(GROUP_MANIFEST.read_text())
+    else:
+        manifest = split_legacy_topics()
+
+    all_topics = TopicGroups(manifest, TOPIC_GROUPS_MAX_BYTES)
+    build_topic_matrices()
+
+
+def infer_topic_matrix(
+    model: "LdaMulticore", num_topics: int, summaries, chunksize: int = 2000
+) -> np.ndarray:
+    """
+    Infers the full topic distribution of every document in one batched pass.
+    Rows whose summary is missing or has no known words are left as zeros.
+    """
+    summaries = list(summaries)
+    matrix = np.zeros((len(summaries), num_topics), dtype=np.float32)
+
+    positions = []
+    bows = []
+    for pos, summary in enumerate(summaries):
+        if not isinstance(summary, list) or not summary:
+            continue
+        bow = model.id2word.doc2bow(summary)
+        if bow:
+            positions.append(pos)
+            bows.append(bow)
+
+    for start in range(0, len(bows), chunksize):
+        gamma, _ = model.inference(bows[start : start + chunksize])
+        gamma /= gamma.sum(axis=1, keepdims=True)
+        matrix[positions[start : start + chunksize]] = gamma
+
+    return matrix
+
+
+def build_topic_matrices():
+    """
+    Memory-maps every group's topic matrix, inferring any that is missing.
+    """
+    global topic_matrices
+    topic_matrices = {}
+
+    for group_name in all_topics:
+        path = GROUPS_DIR / group_name / "topic_matrix.npy"
+        if not path.exists():
+            model, num_topics, df = all_topics[group_name]
+            np.save(path, infer_topic_matrix(model, num_topics, document_summaries(df)))
+        topic_matrices[group_name] = np.load(path, mmap_mode="r")
+
+
+def dominant_topics(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the dominant topic id and its probability for every row.
+    Rows without a distribution get topic -1 and confidence 0.
+    """
+    if matrix.shape[1] == 0:
+        return np.full(len(matrix), -1), np.zeros(len(matrix), dtype=np.float32)
+
+    topic_ids = matrix.argmax(axis=1)
+    confidences = matrix[np.arange(len(matrix)), topic_ids]
+    topic_ids = np.where(confidences > 0, topic_ids, -1)
+    return topic_ids, confidences
+
+
+SIMILARITY_METRICS = ("cosine", "hellinger")
+
+
+def topic_similarity_scores(
+    matrix: np.ndarray, vec: np.ndarray, metric: str = "cosine"
+) -> np.ndarray:
+    """
+    Scores every row of a topic matrix against one topic distribution.
+    Cosine similarity, or 1 - Hellinger distance, so higher is always closer.
+    """
+    if metric == "hellinger":
+        diff = np.sqrt(matrix) - np.sqrt(vec)
+        return 1.0 - np.sqrt(0.5 * np.einsum("ij,ij->i", diff, diff))
+
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vec)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = (matrix @ vec) / norms
+    return np.nan_to_num(scores)
+
+
+def topic_similarity_matrix(
+    matrix: np.ndarray, vecs: np.ndarray, metric: str = "cosine"
+) -> np.ndarray:
+    """
+    Scores every row of a topic matrix against every row of vecs at once;
+    column j matches topic_similarity_scores(matrix, vecs[j], metric).
+    """
+    if metric == "hellinger":
+        a = np.sqrt(matrix)
+        b = np.sqrt(vecs)
+        squared = (
+            np.einsum("ij,ij->i", a, a)[:, None]
+            + np.einsum("ij,ij->i", b, b)[None, :]
+            - 2 * (a @ b.T)
+        )
+        return 1.0 - np.sqrt(0.5 * np.clip(squared, 0, None))
+
+    norms = np.outer(np.linalg.norm(matrix, axis=1), np.linalg.norm(vecs, axis=1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = (matrix @ vecs.T) / norms
+    return np.nan_to_num(scores)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Returns the indices of the k highest scores, best first, without a full sort.
+    """
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def top_k_topics(matrix: np.ndarray, k: int) -> np.ndarray:
+    """
+    Returns the ids of the k most probable topics for every row, best first.
+    """
+    return np.argsort(-matrix, axis=1, kind="stable")[:, :k]
+
+
+# Approximate nearest-neighbour search over the topic vectors. Groups with
+# fewer non-empty documents than ANN_MIN_DOCUMENTS are always scanned exactly,
+# which is faster below roughly that size (20 topics: 13 ms exact vs 7 ms per
+# query at 200k documents, 22 ms vs 7 ms at 300k, and a batch of 20 queries
+# about even at 300k); ANN_SEARCH_K candidates are re-ranked per query
+# (higher = better recall).
+ANN_TREES = int(os.environ.get("ANN_TREES", 10))
+ANN_LEAF_SIZE = 32
+ANN_MIN_DOCUMENTS = int(os.environ.get("ANN_MIN_DOCUMENTS", 300_000))
+ANN_SEARCH_K = int(os.environ.get("ANN_SEARCH_K", 4000))
+
+
+class RandomProjectionForest:
+    """
+    Forest of random projection trees over a point set. Every internal node
+    splits its points by the hyperplane halfway between two random points;
+    leaves hold at most leaf_size point indices.
+    A tree is (root, normals, offsets, children, leaf_starts, leaf_items), where
+    children codes >= 0 are internal nodes and code c < 0 is leaf -c - 1.
+    """
+
+    def __init__(self, points: np.ndarray, n_trees: int, leaf_size: int, seed=0):
+        rng = np.random.default_rng(seed)
+        self.trees = [self._build_tree(points, leaf_size, rng) for _ in range(n_trees)]
+
+    @staticmethod
+    def _build_tree(points: np.ndarray, leaf_size: int, rng) -> tuple:
+        normals, offsets, children = [], [], []
+        leaves = []
+        root = -1
+        stack = [(np.arange(len(points)), -1, 0)]
+
+        while stack:
+            items, parent, side = stack.pop()
+            if len(items) <= leaf_size:
+                code = -len(leaves) - 1
+                leaves.append(items)
+            else:
+                a, b = points[rng.choice(items, 2, replace=False)]
+                normal = a - b
+                offset = float(normal @ (a + b)) / 2
+                right = points[items] @ normal >= offset
+                if right.all() or not right.any():
+                    # Duplicate points can't be separated; split them at random
+                    right = rng.permutation(len(items)) < len(items) // 2
+                code = len(normals)
+                normals.append(normal)
+                offsets.append(offset)
+                children.append([0, 0])
+                stack.append((items[~right], code, 0))
+                stack.append((items[right], code, 1))
+
+            if parent < 0:
+                root = code
+            else:
+                children[parent][side] = code
+
+        dims = points.shape[1]
+        return (
+            root,
+            np.array(normals, dtype=np.float32).reshape(-1, dims),
+            np.array(offsets, dtype=np.float32),
+            np.array(children, dtype=np.int32).reshape(-1, 2),
+            np.cumsum([0] + [len(leaf) for leaf in leaves]),
+            np.concatenate(leaves).astype(np.int32),
+        )
+
+    def candidates(self, query: np.ndarray, search_k: int) -> np.ndarray:
+        """
+        Returns the indices of at least search_k points (when there are that
+        many) from the leaves closest to query across all trees, visiting
+        subtrees by their margin to the splitting hyperplanes.
+        """
+        heap = [(-np.inf, t, tree[0]) for t, tree in enumerate(self.trees)]
+        found = []
+        count = 0
+
+        while heap and count < search_k:
+            priority, t, code = heapq.heappop(heap)
+            _, normals, offsets, children, leaf_starts, leaf_items = self.trees[t]
+            if code < 0:
+                leaf = -code - 1
+                items = leaf_items[leaf_starts[leaf] : leaf_starts[leaf + 1]]
+                found.append(items)
+                count += len(items)
+                continue
+
+            margin = float(normals[code] @ query) - offsets[code]
+            left, right = children[code]
+            heapq.heappush(heap, (max(priority, -margin), t, right))
+            heapq.heappush(heap, (max(priority, margin), t, left))
+
+        if not found:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate(found))
+
+
+class TopicIndex:
+    """
+    Nearest-document lookup over one year group's topic matrix.
+    Only rows with a topic distribution are searchable. Large groups get a
+    random projection forest over the square-rooted distributions (where
+    Euclidean distance is the Hellinger distance); its candidates are
+    re-ranked exactly with the requested metric.
+    """
+
+    def __init__(self, matrix: np.ndarray):
+        self.rows = np.flatnonzero(matrix.any(axis=1))
+        self.forest = None
+        if len(self.rows) >= ANN_MIN_DOCUMENTS:
+            self.forest = RandomProjectionForest(
+                np.sqrt(matrix[self.rows]), ANN_TREES, ANN_LEAF_SIZE
+            )
+
+    def search(
+        self, matrix: np.ndarray, vecs: np.ndarray, k: int, metric: str
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the (df rows, scores) of the k documents most similar to every
+        row of vecs, best first.
+        """
+        if self.forest is None:
+            # Skip the gather when every row is searchable
+            searchable = matrix if len(self.rows) == len(matrix) else matrix[self.rows]
+            scores = topic_similarity_matrix(searchable, vecs, metric)
+            results = []
+            for column in range(len(vecs)):
+                top = top_k_indices(scores[:, column], k)
+                results.append((self.rows[top], scores[top, column]))
+            return results
+
+        # Score the union of every query's candidates in one pass, then rank
+        # each query among its own candidates
+        candidates = [
+            self.forest.candidates(np.sqrt(vec), max(ANN_SEARCH_K, k)) for vec in vecs
+        ]
+        union, positions = np.unique(np.concatenate(candidates), return_inverse=True)
+        rows = self.rows[union]
+        scores = topic_similarity_matrix(matrix[rows], vecs, metric)
+        bounds = np.cumsum([0] + [len(c) for c in candidates])
+
+        results = []
+        for column in range(len(vecs)):
+            own = positions[bounds[column] : bounds[column + 1]]
+            own_scores = scores[own, column]
+            top = top_k_indices(own_scores, k)
+            results.append((rows[own[top]], own_scores[top]))
+        return results
+
+
+def load_topic_indexes():
+    """
+    Loads or builds the nearest-document index of every year group.
+    """
+    global topic_indexes
+    topic_indexes = {}
+
+    for group_name, matrix in topic_matrices.items():
+        path = f"topic_index/{group_name}.pkl"
+        if (index := artifact_cache.get(path, keep_in_memory=False)) is None:
+            index = TopicIndex(matrix)
+            artifact_cache.put(path, index, keep_in_memory=False)
+        topic_indexes[group_name] = index
+
+    return topic_indexes
+
+
+class SearchIndex:
+    """
+    BM25 inverted index over the corpus documents, in get_corpus_documents
+    order. The postings of term t are docs[offsets[t]:offsets[t + 1]] with
+    matching term frequencies in tf.
+    """
+
+    def __init__(self, doc_tokens, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_ids: dict[str, int] = {}
+
+        terms = array("i")
+        docs = array("i")
+        doc_lengths = array("i")
+        for doc, tokens in enumerate(doc_tokens):
+            ids = [
+                self.term_ids.setdefault(token, len(self.term_ids)) for token in tokens
+            ]
+            terms.extend(ids)
+            docs.extend([doc] * len(ids))
+            doc_lengths.append(len(ids))
+
+        self.num_docs = len(doc_lengths)
+        self.doc_lengths = np.frombuffer(doc_lengths, dtype=np.int32).copy()
+        self.avgdl = float(self.doc_lengths.mean()) if self.num_docs else 0.0
+
+        # Sorting (term, doc) keys groups postings by term, docs ascending
+        keys = np.frombuffer(terms, dtype=np.int32).astype(np.int64) * max(
+            self.num_docs, 1
+        ) + np.frombuffer(docs, dtype=np.int32)
+        keys, tf = np.unique(keys, return_counts=True)
+        self.docs = (keys % max(self.num_docs, 1)).astype(np.int32)
+        self.tf = tf.astype(np.int32)
+        self.offsets = np.searchsorted(
+            keys // max(self.num_docs, 1), np.arange(len(self.term_ids) + 1)
+        ).astype(np.int64)
+
+    def search(self, tokens: list[str], k: int) -> tuple[list[tuple[int, float]], int]:
+        """
+        Returns the k best (doc, score) pairs and the number of matching docs.
+        """
+        scores = np.zeros(self.num_docs, dtype=np.float32)
+
+        for token in set(tokens):
+            if (term := self.term_ids.get(token)) is None:
+                continue
+            lo, hi = self.offsets[term], self.offsets[term + 1]
+            docs = self.docs[lo:hi]
+            tf = self.tf[lo:hi]
+
+            df = hi - lo
+            idf = np.log(1 + (self.num_docs - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[docs] / self.avgdl)
+            scores[docs] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        matches = np.flatnonzero(scores)
+        top = heapq.nlargest(k, matches.tolist(), key=scores.__getitem__)
+        return [(doc, float(scores[doc])) for doc in top], len(matches)
+
+
+def load_search_index():
+    global search_index
+
+    if (
+        search_index := artifact_cache.get("search_index.pkl", keep_in_memory=False)
+    ) is None:
+        summaries = []
+        texts = []
+        for group_name, (model, num_topics, df) in all_topics.items():
+            authors = group_authors[group_name]
+            if "processed_summary" in df.columns:
+                summaries.extend(
+                    summary if isinstance(summary, list) else []
+                    for summary in df["processed_summary"]
+                )
+            else:
+                summaries.extend([] for _ in range(len(df)))
+            titles = df["title"] if "title" in df.columns else [""] * len(df)
+            for pos, title in enumerate(titles):
+                texts.append(f"{title} {' '.join(authors.names_of(pos))}")
+
+        # Titles and author names go through the same preprocessing as queries
+        doc_tokens = (
+            summary + tokens
+            for summary, tokens in zip(summaries, preprocess_many(texts))
+        )
+        search_index = SearchIndex(doc_tokens)
+        artifact_cache.put("search_index.pkl", search_index, keep_in_memory=False)
+
+    return search_index
+
+
+def name_trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class AuthorSuggester:
+    """
+    Prefix and fuzzy lookup over author names.
+    Prefixes are matched against the whole name and against each word of it
+    with bisect over sorted keys; fuzzy matches come from a trigram index and
+    are reranked by edit similarity. Ties are broken by weighted degree.
+    """
+
+    def __init__(self, names: list[str], ranks: np.ndarray):
+        self.names = names
+        self.ranks = ranks
+
+        # Sorted casefolded keys for full names and for every word of a name
+        entries = sorted(
+            (word, i)
+            for i, name in enumerate(names)
+            for word in {name.casefold(), *name.casefold().split()}
+        )
+        self.keys = [key for key, _ in entries]
+        self.key_ids = np.array([i for _, i in entries], dtype=np.int32)
+
+        # Trigram postings in the same compact offset form as the search index
+        self.trigram_ids: dict[str, int] = {}
+        grams = array("i")
+        ids = array("i")
+        self.trigram_counts = np.zeros(len(names), dtype=np.int32)
+        for i, name in enumerate(names):
+            trigrams = name_trigrams(name.casefold())
+            self.trigram_counts[i] = len(trigrams)
+            for trigram in trigrams:
+                grams.append(
+                    self.trigram_ids.setdefault(trigram, len(self.trigram_ids))
+                )
+                ids.append(i)
+        grams = np.frombuffer(grams, dtype=np.int32)
+        order = np.argsort(grams, kind="stable")
+        self.postings = np.frombuffer(ids, dtype=np.int32)[order]
+        self.offsets = np.searchsorted(
+            grams[order], np.arange(len(self.trigram_ids) + 1)
+        ).astype(np.int64)
+
+    def prefix(self, query: str, limit: int) -> list[int]:
+        query = query.casefold()
+        lo = bisect.bisect_left(self.keys, query)
+        hi = bisect.bisect_left(self.keys, query + "\uffff")
+        ids = np.unique(self.key_ids[lo:hi])
+        return ids[top_k_indices(self.ranks[ids], limit)].tolist()
+
+    def fuzzy(self, query: str, limit: int, candidates: int = 50) -> list[int]:
+        query = query.casefold()
+        trigrams = name_trigrams(query)
+        postings = [
+            self.postings[self.offsets[t] : self.offsets[t + 1]]
+            for trigram in trigrams
+            if (t := self.trigram_ids.get(trigram)) is not None
+        ]
+        if not postings:
+            return []
+
+        overlap = np.bincount(np.concatenate(postings), minlength=len(self.names))
+        ids = np.flatnonzero(overlap)
+        overlap = overlap[ids]
+        jaccard = overlap / (len(trigrams) + self.trigram_counts[ids] - overlap)
+        ids = ids[top_k_indices(jaccard, candidates)]
+
+        scored = [
+            (SequenceMatcher(None, query, self.names[i].casefold()).ratio(), i)
+            for i in ids.tolist()
+        ]
+        scored = [(score, i) for score, i in scored if score >= 0.5]
+        scored.sort(key=lambda x: (x[0], self.ranks[x[1]]), reverse=True)
+        return [i for _, i in scored[:limit]]
+
+    def suggest(self, query: str, limit: int = 10) -> list[dict]:
+        results = [
+            {"name": self.names[i], "match": "prefix"}
+            for i in self.prefix(query, limit)
+        ]
+
+        # Only fall back to fuzzy matching when prefixes don't fill the page
+        if len(results) < limit:
+            seen = {result["name"] for result in results}
+            for i in self.fuzzy(query, limit):
+                if self.names[i] not in seen and len(results) < limit:
+                    seen.add(self.names[i])
+                    results.append({"name": self.names[i], "match": "fuzzy"})
+
+        return results
+
+
+def load_author_suggester():
+    global author_suggester
+
+    if (
+        author_suggester := artifact_cache.get(
+            "author_suggester.pkl", keep_in_memory=False
+        )
+    ) is None:
+        author_suggester = AuthorSuggester(
+            list(all_authors.names), all_authors.degrees(weighted=True)
+        )
+        artifact_cache.put(
+            "author_suggester.pkl", author_suggester, keep_in_memory=False
+        )
+
+    return author_suggester
+
+
+readiness.add("dataset", lambda: load_dataset(columns=["authors"]))
+readiness.add("topics", load_topics)
+readiness.add("topic_indexes", load_topic_indexes, ("topics",))
+readiness.add("authors", load_author_lists, ("dataset", "topics"))
+readiness.add("graph", load_author_graph)
+readiness.add("author_index", load_author_index, ("topics", "authors"))
+readiness.add("author_stats", build_author_stats, ("authors",))
+readiness.add("search", load_search_index, ("topics", "authors"))
+readiness.add("suggester", load_author_suggester, ("graph", "author_stats"))
+
+
+def requires(*stages: str):
+    """
+    Loads the given readiness stages before the route runs; answers 503 if
+    one of them fails to load.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                readiness.ensure(*stages)
+            except Exception as e:
+                return (
+                    jsonify(
+                        {"error": f"Not ready: {e}", "stages": readiness.snapshot()}
+                    ),
+                    HTTPStatus.SERVICE_UNAVAILABLE,
+                )
+            return view(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@app.route("/api/health")
+def health():
+    """
+    Checks the health of the API and reports which data is loaded.
+    Never triggers loading itself.
+    """
+    return jsonify(
+        {
+            "status": "ok",
+            "ready": readiness.ready(),
+            "import_seconds": IMPORT_SECONDS,
+            "stages": readiness.snapshot(),
+        }
+    )
+
+
+@app.route("/api/cache-stats")
+def cache_stats():
+    """
+    Returns hit/miss statistics of the artifact, word cloud and upload caches
+    and of the loaded year groups.
+    """
+    return jsonify(
+        {
+            "artifacts": artifact_cache.info(),
+            "wordclouds": wordcloud_cache.info(),
+            "uploads": upload_cache.info(),
+            "topic_groups": (
+                all_topics.info() if isinstance(all_topics, TopicGroups) else None
+            ),
+        }
+    )
+
+
+@app.route("/api/corpus-overview")
+@requires("topics", "graph")
+def corpus_overview():
+    """
+    Returns the corpus overview.
+    """
+    total_documents = sum(all_topics.num_documents(name) for name in all_topics)
+    total_topics = sum(all_topics.num_topics(name) for name in all_topics)
+    overview = {
+        "total_documents": total_documents,
+        "total_authors": all_authors.number_of_nodes(),
+        "total_topics": total_topics,
+        "total_connections": all_authors.number_of_edges(),
+    }
+    return jsonify(overview)
+
+
+def get_corpus_documents() -> list[dict]:
+    """
+    Returns every corpus document with its top topics, in all_topics order.
+    """
+    if (to_return := artifact_cache.get("corpus_documents.pkl")) is None:
+        print("Loading api/corpus-documents")
+        to_return = []
+
+        # Iterate through all topics to get documents with their dominant topics
+        for group_name, (model, num_topics, df) in all_topics.items():
+            matrix = topic_matrices[group_name]
+            top_topics = top_k_topics(matrix, 3)
+            authors = group_authors[group_name]
+
+            # Get top 3 words for every topic once instead of once per document
+            topic_words = [
+                ", ".join(word for word, _ in model.show_topic(topic_id, topn=3))
+                for topic_id in range(num_topics)
+            ]
+
+            for pos, (_, row) in enumerate(df.iterrows()):
+                # Top 3 topics for this document, skipping negligible ones the
+                # same way get_document_topics does
+                topic_keywords = [
+                    f"{topic_words[topic_id]} ({matrix[pos, topic_id]:.2f})"
+                    for topic_id in top_topics[pos]
+                    if matrix[pos, topic_id] >= model.minimum_probability
+                ]
+                topics_str = " | ".join(topic_keywords)
+
+                to_return.append(
+                    {
+                        "title": row["title"],
+                        "authors": authors.names_of(pos),
+                        "publicationYear": (
+                            parse_date(row["published_date"])[2]
+                            if "published_date" in row
+                            else group_name.split("-")[0]
+                        ),
+                        "topics": topics_str,
+                    }
+                )
+
+        artifact_cache.put("corpus_documents.pkl", to_return)
+
+    return to_return
+
+
+CORPUS_DOCUMENTS_ARGS = (
+    "offset",
+    "limit",
+    "year_group",
+    "year",
+    "topic_id",
+    "author",
+    "sort",
+    "order",
+    "format",
+)
+CORPUS_DOCUMENTS_PAGE_SIZE = 50
+CORPUS_DOCUMENTS_MAX_PAGE_SIZE = 1000
+
+# (artifact fingerprint, columns) used to filter and sort the corpus documents
+_corpus_columns: tuple[str, dict[str, Any]] | None = None
+
+
+def corpus_document_columns(documents: list[dict]) -> dict[str, Any]:
+    """
+    Returns the corpus documents as columns aligned with get_corpus_documents:
+    year group code, publication year, dominant topic id and title, plus the
+    offset of each year group in the concatenated list.
+    """
+    global _corpus_columns
+
+    fingerprint = artifact_fingerprint()
+    if _corpus_columns is not None and _corpus_columns[0] == fingerprint:
+        return _corpus_columns[1]
+
+    group_names = list(all_topics.keys())
+    sizes = [all_topics.num_documents(name) for name in group_names]
+    offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+
+    columns = {
+        "group_names": group_names,
+        "group_offsets": dict(zip(group_names, offsets[:-1].tolist())),
+        "group": np.repeat(np.arange(len(group_names)), sizes),
+        "dominant_topic": (
+            np.concatenate(
+                [dominant_topics(topic_matrices[name])[0] for name in group_names]
+            )
+            if group_names
+            else np.zeros(0, dtype=np.int64)
+        ),
+        "year": np.array(
+            [int(doc["publicationYear"]) for doc in documents], dtype=np.int32
+        ),
+        "title": np.array([str(doc["title"]) for doc in documents], dtype=object),
+    }
+
+    _corpus_columns = (fingerprint, columns)
+    return columns
+
+
+@app.route("/api/corpus-documents")
+@requires("topics", "authors", "author_index")
+def corpus_documents():
+    """
+    Returns the corpus documents with their topics.
+
+    Without query parameters the whole corpus is returned as a list. Any of
+    the parameters below returns a page instead:
+    {"documents", "total", "offset", "limit", "next_offset"}.
+    - offset, limit: page window (limit defaults to 50, at most 1000)
+    - year_group, year, topic_id, author: filters (author is an exact name)
+    - sort: "year" or "title", order: "asc" (default) or "desc"
+    - format=ndjson: stream the matching rows, one JSON object per line
+    """
+    documents = get_corpus_documents()
+
+    if not any(arg in request.args for arg in CORPUS_DOCUMENTS_ARGS):
+        return jsonify(documents), 200
+
+    columns = corpus_document_columns(documents)
+    mask = np.ones(len(documents), dtype=bool)
+
+    if year_group := request.args.get("year_group"):
+        if year_group not in columns["group_offsets"]:
+            return (
+                jsonify({"error": f"Year group '{year_group}' not found"}),
+                HTTPStatus.NOT_FOUND,
+            )
+        mask &= columns["group"] == columns["group_names"].index(year_group)
+
+    if (year := request.args.get("year", type=int)) is not None:
+        mask &= columns["year"] == year
+
+    if (topic_id := request.args.get("topic_id", type=int)) is not None:
+        mask &= columns["dominant_topic"] == topic_id
+
+    if author := request.args.get("author"):
+        author_mask = np.zeros(len(documents), dtype=bool)
+        author_mask[
+            [
+                columns["group_offsets"][group_name] + pos
+                for group_name, pos, _ in author_papers.get(author, [])
+            ]
+        ] = True
+        mask &= author_mask
+
+    selected = np.flatnonzero(mask)
+
+    sort = request.args.get("sort")
+    if sort not in (None, "year", "title"):
+        return jsonify({"error": f"Unknown sort '{sort}'"}), HTTPStatus.BAD_REQUEST
+    if sort:
+        order = np.argsort(columns[sort][selected], kind="stable")
+        if request.args.get("order", "asc") == "desc":
+            order = order[::-1]
+        selected = selected[order]
+
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    if request.args.get("format") == "ndjson":
+        limit = request.args.get("limit", type=int)
+        if limit is None:
+            page = selected[offset:]
+        else:
+            page = selected[offset : offset + max(limit, 1)]
+
+        def generate():
+            for i in page:
+                yield json.dumps(documents[i]) + "\n"
+
+        return Response(generate(), mimetype="application/x-ndjson")
+
+    limit = request.args.get("limit", CORPUS_DOCUMENTS_PAGE_SIZE, type=int)
+    limit = min(max(limit, 1), CORPUS_DOCUMENTS_MAX_PAGE_SIZE)
+    page = selected[offset : offset + limit]
+    next_offset = offset + limit if offset + limit < len(selected) else None
+
+    return jsonify(
+        {
+            "documents": [documents[i] for i in page],
+            "total": len(selected),
+            "offset": offset,
+            "limit": limit,
+            "next_offset": next_offset,
+        }
+    )
+
+
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
+
+@app.route("/api/search")
+@requires("topics", "authors", "search")
+def search():
+    """
+    Full-text search over paper titles, summaries and authors, ranked by BM25.
+    Query parameters: q, offset, limit (defaults to 20, at most 100).
+    """
+    query = request.args.get("q", "").strip()
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    limit = request.args.get("limit", SEARCH_PAGE_SIZE, type=int)
+    limit = min(max(limit, 1), SEARCH_MAX_PAGE_SIZE)
+
+    hits, total = search_index.search(preprocess_text(query), offset + limit)
+    documents = get_corpus_documents()
+    next_offset = offset + limit if offset + limit < total else None
+
+    return jsonify(
+        {
+            "documents": [
+                {**documents[doc], "score": score} for doc, score in hits[offset:]
+            ],
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": next_offset,
+        }
+    )
+
+
+@app.route("/api/topic-count-per-group")
+@requires("topics")
+def topic_count_per_group():
+    """
+    Returns the topic count per group.
+    """
+    result = [
+        {"group": group_name, "topic_count": all_topics.num_topics(group_name)}
+        for group_name in all_topics
+    ]
+
+    print(result)
+
+    return jsonify(result)
+
+
+@app.route("/api/trending-topics-per-group")
+@requires("topics")
+def trending_topics_per_group():
+    """
+    Returns the trending topics per year with top keywords.
+    Vectorized version for better performance.
+    """
+
+    if (result := artifact_cache.get("trending_topics_per_group.pkl")) is None:
+        result = []
+        for group_name, (model, num_topics, df) in all_topics.items():
+            # Get all topics for this year group
+            topics_data = []
+
+            # Count documents per dominant topic from the precomputed matrix
+            dominant, _ = dominant_topics(topic_matrices[group_name])
+            topic_counts = np.bincount(
+                dominant[dominant >= 0], minlength=num_topics
+            ).tolist()
+
+            for topic_id in range(num_topics):
+                # Get top 10 words for this topic
+                top_words = model.show_topic(topic_id, topn=10)
+                keywords = [
+                    {"word": word, "weight": float(weight)}
+                    for word, weight in top_words
+                ]
+
+                # Get document count from precomputed counts
+                topic_count = topic_counts[topic_id]
+
+                topics_data.append(
+                    {
+                        "topic_id": topic_id,
+                        "keywords": keywords,
+                        "document_count": topic_count,
+                    }
+                )
+
+            # Sort by document count to get "trending" topics
+            topics_data.sort(key=lambda x: x["document_count"], reverse=True)
+
+            result.append(
+                {
+                    "group": group_name,
+                    "topics": topics_data[:5],  # Return top 5 trending topics
+                }
+            )
+        artifact_cache.put("trending_topics_per_group.pkl", result)
+
+    return jsonify(result)
+
+
+@app.route("/api/corpus-topics")
+@requires("topics")
+def corpus_topics():
+    topics_by_group = []
+
+    for group_name in all_topics:
+        topics_by_group.append(
+            {
+                "group_name": group_name,
+                "topics": all_topics.num_topics(group_name),
+                "total_documents": all_topics.num_documents(group_name),
+            }
+        )
+
+    return jsonify(topics_by_group)
+
+
+@app.route("/api/corpus-topics/<year_group>", methods=["GET"])
+@requires("topics")
+def corpus_topics_detail(year_group):
+    """
+    Returns detailed topics with documents and coherence scores for a specific year group.
+    Schema: [{"topic": string, "documents": [{"title": string}], "coherence": number}]
+    """
+
+    # Find the model and data for the specified year group
+    if year_group not in all_topics:
+        return (
+            jsonify({"error": f"Year group '{year_group}' not found"}),
+            HTTPStatus.NOT_FOUND,
+        )
+
+    if (to_return := artifact_cache.get(f"corpus_topics/{year_group}.pkl")) is None:
+        model, num_topics, df = all_topics[year_group]
+        to_return = []
+        # Dominant topic and confidence for all documents from the precomputed matrix
+        dominant, confidence = dominant_topics(topic_matrices[year_group])
+        titles = (
+            df["title"].tolist() if "title" in df.columns else ["Unknown"] * len(df)
+        )
+
+        # Group documents by dominant topic
+        for topic_id in range(num_topics):
+            # Get top words for this topic to create the topic label
+            topic_words = model.show_topic(topic_id, topn=3)
+            topic_label = ", ".join([word for word, _ in topic_words])
+
+            # Get documents where this is the dominant topic, sorted by
+            # confidence score and limited to top 10 documents
+            positions = np.flatnonzero(dominant == topic_id)
+            order = np.argsort(-confidence[positions], kind="stable")[:10]
+
+            documents = []
+            for pos in positions[order]:
+                documents.append(
+                    {
+                        "title": titles[pos],
+                        "confidence": float(confidence[pos]),
+                    }
+                )
+
+            to_return.append({"topic": topic_label, "documents": documents})
+        artifact_cache.put(f"corpus_topics/{year_group}.pkl", to_return)
+
+    return jsonify(to_return)
+
+
+def add_author_papers(
+    author_name: str,
+    nodes: list[dict],
+    links: list[dict],
+    added_nodes: set,
+    added_links: set,
+):
+    """
+    Adds the papers of an author, and links from the author and from any
+    already added co-authors to those papers, using the author index.
+    """
+    for group_name, pos, paper_id in author_papers.get(author_name, []):
+        authors_list = group_authors[group_name].names_of(pos)
+
+        # Add paper node
+        if paper_id not in added_nodes:
+            nodes.append({"id": paper_id, "group": "paper", "year": group_name})
+            added_nodes.add(paper_id)
+
+        # Link author to paper
+        link_key = (author_name, paper_id)
+        if link_key not in added_links:
+            links.append({"source": author_name, "target": paper_id, "value": 1})
+            added_links.add(link_key)
+
+        # Link co-authors to the same paper
+        for co_author in authors_list:
+            if co_author != author_name and co_author in added_nodes:
+                link_key = (co_author, paper_id)
+                if link_key not in added_links:
+                    links.append({"source": co_author, "target": paper_id, "value": 1})
+                    added_links.add(link_key)
+
+
+AUTHOR_SUGGEST_LIMIT = 10
+AUTHOR_SUGGEST_MAX_LIMIT = 50
+
+
+@app.route("/api/author-suggest")
+@requires("suggester")
+def author_suggest():
+    """
+    Suggests author names for a partial or misspelled query (?q=).
+    Prefix matches come first, ranked by weighted degree, then fuzzy matches.
+    """
+    query = request.args.get("q", "").strip()
+    limit = request.args.get("limit", AUTHOR_SUGGEST_LIMIT, type=int)
+    limit = min(max(limit, 1), AUTHOR_SUGGEST_MAX_LIMIT)
+
+    if not query:
+        return jsonify({"suggestions": []})
+
+    suggestions = author_suggester.suggest(query, limit)
+    for suggestion in suggestions:
+        suggestion["paper_count"] = get_author_paper_count(suggestion["name"])
+
+    return jsonify({"suggestions": suggestions})
+
+
+def author_not_found(author_name: str):
+    suggestions = [
+        suggestion["name"]
+        for suggestion in author_suggester.suggest(author_name, AUTHOR_SUGGEST_LIMIT)
+    ]
+    return (
+        jsonify(
+            {
+                "nodes": [],
+                "links": [],
+                "message": "Author not found",
+                "suggestions": suggestions,
+            }
+        ),
+        200,
+    )
+
+
+@app.route("/api/author-networks", methods=["POST"])
+@requires("author_index", "suggester")
+def author_networks():
+    """
+    Returns the author networks showing collaborations.
+    """
+    data = request.get_json()
+    author_name = data.get("author_name", "")
+
+    if not author_name:
+        return jsonify({"nodes": [], "links": []}), 200
+
+    nodes = []
+    links = []
+    added_nodes = set()
+    added_links = set()
+
+    # Check if author exists in the graph
+    if author_name not in all_authors:
+        return author_not_found(author_name)
+
+    # Add the main author node
+    nodes.append({"id": author_name, "group": "author"})
+    added_nodes.add(author_name)
+
+    # Add co-author nodes and links for the 50 strongest collaborators
+    for co_author, weight in strongest_coauthors(author_name, 50):
+        if co_author not in added_nodes:
+            nodes.append({"id": co_author, "group": "co-author", "weight": weight})
+            added_nodes.add(co_author)
+
+        link_key = tuple(sorted([author_name, co_author]))
+        if link_key not in added_links:
+            links.append({"source": author_name, "target": co_author, "value": weight})
+            added_links.add(link_key)
+
+    # Add papers from the author index
+    add_author_papers(author_name, nodes, links, added_nodes, added_links)
+
+    response = {
+        "nodes": nodes,
+        "links": links,
+        "statistics": {
+            "total_co_authors": len([n for n in nodes if n["group"] == "co-author"]),
+            "total_papers": len([n for n in nodes if n["group"] == "paper"]),
+            "total_connections": len(links),
+        },
+    }
+    return jsonify(response)
+
+
+@app.route("/api/author-networks", methods=["GET"])
+@requires("author_index", "suggester")
+def author_networks_get():
+    """
+    GET endpoint to return either a full (limited) author graph or a subgraph
+    for a specific author when ?author_name= is provided.
+    The full graph view takes ?level=authors (top authors by weighted degree,
+    the default) or ?level=communities (communities collapsed into supernodes),
+    plus ?limit= nodes and ?max_links= links.
+    """
+    author_name = request.args.get("author_name", "")
+
+    # If an author is requested, mirror the POST behavior (return subgraph)
+    if author_name:
+        nodes = []
+        links = []
+        added_nodes = set()
+        added_links = set()
+
+        if author_name not in all_authors:
+            return author_not_found(author_name)
+
+        nodes.append(
+            {
+                "id": author_name,
+                "group": "author",
+                "paper_count": get_author_paper_count(author_name),
+            }
+        )
+        added_nodes.add(author_name)
+
+        for co_author, weight in strongest_coauthors(author_name, 50):
+            if co_author not in added_nodes:
+                nodes.append(
+                    {
+                        "id": co_author,
+                        "group": "co-author",
+                        "weight": weight,
+                        "paper_count": get_author_paper_count(co_author),
+                    }
+                )
+                added_nodes.add(co_author)
+
+            link_key = tuple(sorted([author_name, co_author]))
+            if link_key not in added_links:
+                links.append(
+                    {"source": author_name, "target": co_author, "value": weight}
+                )
+                added_links.add(link_key)
+
+        # papers
+        add_author_papers(author_name, nodes, links, added_nodes, added_links)
+
+        # Calculate statistics
+        statistics = {
             "total_co_authors": len([n for n in nodes if n["group"] == "co-author"]),
             "total_papers": len([n for n in nodes if n["group"] == "paper"]),
             "total_connections": len(links),
+        }
+
+        response = {"nodes": nodes, "links": links, "statistics": statistics}
+        return jsonify(response)
+
+    # Otherwise return a precomputed overview of the full graph
+    level = request.args.get("level", "authors")
+    if level not in AUTHOR_NETWORK_LEVELS:
+        return jsonify({"error": f"Unknown level '{level}'"}), HTTPStatus.BAD_REQUEST
+
+    limit = request.args.get("limit", AUTHOR_NETWORK_LIMIT, type=int)
+    limit = min(max(limit, 1), AUTHOR_NETWORK_MAX_LIMIT)
+    max_links = request.args.get("max_links", AUTHOR_NETWORK_LINKS, type=int)
+    max_links = min(max(max_links, 0), AUTHOR_NETWORK_MAX_LINKS)
+
+    # One view per level at the largest size; requests take a prefix of it
+    path = f"author_network_views/{level}.pkl"
+    if (base := artifact_cache.get(path)) is None:
+        if level == "communities":
+            if (membership := artifact_cache.get("communities.pkl")) is None:
+                # Communities come from the network statistics job
+                network_statistics_task.start()
+                return (
+                    jsonify(
+                        {
+                            "nodes": [],
+                            "links": [],
+                            "message": "Communities are still being computed",
+                            "job": network_statistics_task.snapshot(),
+                        }
+                    ),
+                    HTTPStatus.ACCEPTED,
+                )
+            base = community_network_base(membership)
+        else:
+            base = top_author_network_base()
+        artifact_cache.put(path, base)
+
+    return jsonify(slice_network_view(base, limit, max_links))
+
+
+AUTHOR_NETWORK_LEVELS = ("authors", "communities")
+AUTHOR_NETWORK_LIMIT = 1000
+AUTHOR_NETWORK_MAX_LIMIT = 5000
+AUTHOR_NETWORK_LINKS = 2000
+AUTHOR_NETWORK_MAX_LINKS = 20000
+
+
+def top_author_network_base() -> dict:
+    """
+    The AUTHOR_NETWORK_MAX_LIMIT most connected authors by weighted degree and
+    every link among them, strongest first, so a view of any size is a prefix.
+    Links are stored as (source rank, target rank) into the node list.
+    """
+    arrays = graph_arrays()
+    names = arrays["names"]
+
+    top = top_k_indices(arrays["weighted_degree"], AUTHOR_NETWORK_MAX_LIMIT)
+    rank = np.full(len(names), -1, dtype=np.int64)
+    rank[top] = np.arange(len(top))
+
+    # Only include edges where BOTH nodes are in our selected node set
+    u, v, weight = arrays["u"], arrays["v"], arrays["weight"]
+    inside = np.flatnonzero((rank[u] >= 0) & (rank[v] >= 0))
+    inside = inside[np.argsort(-weight[inside], kind="stable")]
+
+    nodes = [
+        {
+            "id": names[i],
+            "group": "author",
+            # precomputed weighted degree for node sizing
+            "weight": int(arrays["weighted_degree"][i]),
+            "paper_count": int(arrays["paper_count"][i]),
+        }
+        for i in top.tolist()
+    ]
+
+    return {
+        "nodes": nodes,
+        "link_ranks": np.stack([rank[u[inside]], rank[v[inside]]]).astype(np.int32),
+        "link_values": weight[inside],
+        "statistics": {"level": "authors"},
+    }
+
+
+def community_network_base(membership: np.ndarray) -> dict:
+    """
+    The graph zoomed out: each community collapsed into one supernode, with
+    links weighted by the total collaborations between two communities.
+    Keeps the AUTHOR_NETWORK_MAX_LIMIT heaviest communities and all links
+    among them, laid out like top_author_network_base.
+    """
+    arrays = graph_arrays()
+    names = arrays["names"]
+    degrees = arrays["weighted_degree"]
+    num_communities = int(membership.max()) + 1 if len(membership) else 0
+
+    sizes = np.bincount(membership, minlength=num_communities)
+    weights = np.bincount(membership, weights=degrees, minlength=num_communities)
+    papers = np.bincount(
+        membership, weights=arrays["paper_count"], minlength=num_communities
+    )
+
+    # Members of every community, most connected first
+    order = np.lexsort((-degrees, membership))
+    starts = np.searchsorted(membership[order], np.arange(num_communities))
+
+    top = top_k_indices(weights, AUTHOR_NETWORK_MAX_LIMIT)
+    rank = np.full(num_communities, -1, dtype=np.int64)
+    rank[top] = np.arange(len(top))
+
+    # Sum edge weights between each pair of selected communities
+    cu = membership[arrays["u"]]
+    cv = membership[arrays["v"]]
+    between = (cu != cv) & (rank[cu] >= 0) & (rank[cv] >= 0)
+    lo = np.minimum(cu[between], cv[between]).astype(np.int64)
+    hi = np.maximum(cu[between], cv[between]).astype(np.int64)
+    pairs, inverse = np.unique(lo * num_communities + hi, return_inverse=True)
+    pair_weights = np.bincount(inverse, weights=arrays["weight"][between])
+    strongest = np.argsort(-pair_weights, kind="stable")
+    pairs = pairs[strongest]
+
+    nodes = []
+    for c in top.tolist():
+        members = order[starts[c] : starts[c] + min(sizes[c], 5)]
+        top_authors = [names[i] for i in members.tolist()]
+        nodes.append(
+            {
+                "id": f"community-{c}",
+                "group": "community",
+                "label": top_authors[0],
+                "size": int(sizes[c]),
+                "weight": int(weights[c]),
+                "paper_count": int(papers[c]),
+                "top_authors": top_authors,
+            }
+        )
+
+    return {
+        "nodes": nodes,
+        "link_ranks": np.stack(
+            [rank[pairs // num_communities], rank[pairs % num_communities]]
+        ).astype(np.int32),
+        "link_values": pair_weights[strongest],
+        "statistics": {"level": "communities", "communities": num_communities},
+    }
+
+
+def slice_network_view(base: dict, limit: int, max_links: int) -> dict:
+    """
+    The first limit nodes of a base view and the strongest max_links links
+    among them.
+    """
+    nodes = base["nodes"][:limit]
+    sources, targets = base["link_ranks"]
+    kept = np.flatnonzero((sources < limit) & (targets < limit))[:max_links]
+
+    links = [
+        {"source": nodes[a]["id"], "target": nodes[b]["id"], "value": int(w)}
+        for a, b, w in zip(
+            sources[kept].tolist(),
+            targets[kept].tolist(),
+            base["link_values"][kept].tolist(),
+        )
+    ]
+
+    return {
+        "nodes": nodes,
+        "links": links,
+        "statistics": {
+            "nodes": len(nodes),
+            "links": len(links),
+            **base["statistics"],
         },
     }
-    return jsonify(response)
 
 
-@app.route("/api/author-networks", methods=["GET"])
-def author_networks_get():
+EGO_NETWORK_DEFAULTS = {"depth": 2, "fanout": 10, "max_nodes": 200}
+EGO_NETWORK_LIMITS = {"depth": (1, 3), "fanout": (1, 100), "max_nodes": (1, 1000)}
+
+
+@app.route("/api/author-networks/ego")
+@requires("suggester")
+def author_networks_ego():
+    """
+    Returns the k-hop collaboration network around ?author_name=.
+    ?depth= hops (1-3), ?fanout= strongest collaborators expanded per node and
+    ?max_nodes= overall node budget; links are capped by ?max_links=.
+    """
+    author_name = request.args.get("author_name", "")
+    if not author_name:
+        return jsonify({"nodes": [], "links": []}), 200
+
+    if author_name not in all_authors:
+        return author_not_found(author_name)
+
+    params = {}
+    for name, default in EGO_NETWORK_DEFAULTS.items():
+        low, high = EGO_NETWORK_LIMITS[name]
+        params[name] = min(max(request.args.get(name, default, type=int), low), high)
+    max_links = request.args.get("max_links", AUTHOR_NETWORK_LINKS, type=int)
+    max_links = min(max(max_links, 0), AUTHOR_NETWORK_MAX_LINKS)
+
+    return jsonify(ego_network(author_name, max_links=max_links, **params))
+
+
+def compute_network_statistics(progress) -> dict:
+    """
+    Computes the co-author graph statistics. Runs as a background task.
+    """
+    import networkx as nx
+    from scipy.sparse.csgraph import connected_components
+
+    readiness.ensure("graph")
+    graph = all_authors
+    total = 4
+
+    # Degree distribution and average degree
+    progress(1, total, "Degree distribution")
+    degrees = graph.degrees()
+    degree_counts = np.bincount(degrees) if len(degrees) else np.zeros(0, np.int64)
+    present = np.flatnonzero(degree_counts)
+
+    progress(2, total, "Connected components")
+    num_components, labels = connected_components(graph.to_csr_matrix(), directed=False)
+    component_sizes = np.bincount(labels, minlength=num_components)
+
+    # Clustering and Louvain need networkx, so export a temporary copy
+    progress(3, total, "Clustering")
+    nx_graph = graph.to_networkx()
+    average_clustering = nx.average_clustering(nx_graph) if len(degrees) else 0.0
+
+    # Calculate number of communities using Louvain algorithm
+    progress(4, total, "Communities")
+    partition = nx.community.louvain_communities(nx_graph)
+    communities = len(partition)
+    del nx_graph
+
+    # Community of every node, in graph node order, for the collapsed view
+    membership = np.zeros(graph.number_of_nodes(), dtype=np.int32)
+    for community_id, members in enumerate(partition):
+        membership[[graph.ids[member] for member in members]] = community_id
+    artifact_cache.put("communities.pkl", membership, keep_in_memory=False)
+
+    to_return = {
+        "nodes": graph.number_of_nodes(),
+        "edges": graph.number_of_edges(),
+        "communities": communities,
+        "average_degree": float(degrees.mean()) if len(degrees) else 0,
+        "connected_components": int(num_components),
+        "largest_component": int(component_sizes.max(initial=0)),
+        "average_clustering": average_clustering,
+        "degree_distribution": {
+            "degree": present.tolist(),
+            "count": degree_counts[present].tolist(),
+        },
+    }
+
+    artifact_cache.put("network_statistics.pkl", to_return)
+    return to_return
+
+
+network_statistics_task = BackgroundTask(
+    "network-statistics", compute_network_statistics
+)
+
+
+def refresh_network_statistics():
+    """
+    Starts computing the network statistics unless an up-to-date copy exists.
+    """
+    if artifact_cache.get("network_statistics.pkl") is None:
+        network_statistics_task.start()
+
+
+@app.route("/api/network-statistics")
+@requires("graph")
+def network_statistics():
+    """
+    Returns the co-author graph statistics.
+    They are computed in the background; while a recompute runs the last
+    completed result is served, and before the first one finishes the cheap
+    counts are returned with status 202.
+    """
+    if (to_return := artifact_cache.get("network_statistics.pkl")) is None:
+        network_statistics_task.start()
+
+        to_return = network_statistics_task.result or artifact_cache.peek(
+            "network_statistics.pkl"
+        )
+        if to_return is None:
+            nodes = all_authors.number_of_nodes()
+            edges = all_authors.number_of_edges()
+            return (
+                jsonify(
+                    {
+                        "nodes": nodes,
+                        "edges": edges,
+                        "communities": None,
+                        "average_degree": 2 * edges / nodes if nodes else 0,
+                        "job": network_statistics_task.snapshot(),
+                    }
+                ),
+                HTTPStatus.ACCEPTED,
+            )
+
+    return jsonify({**to_return, "job": network_statistics_task.snapshot()})
+
+
+@app.route("/api/network-statistics/status")
+def network_statistics_status():
+    """
+    Returns the status and progress of the network statistics job.
+    """
+    return jsonify(network_statistics_task.snapshot())
+
+
+@app.route("/api/network-statistics/refresh", methods=["POST"])
+def network_statistics_refresh():
+    """
+    Forces a recompute of the network statistics in the background.
+    """
+    network_statistics_task.start()
+    return jsonify(network_statistics_task.snapshot()), HTTPStatus.ACCEPTED
+
+
+def parse_similarity_metric():
+    """
+    Reads the optional "metric" form field; returns (metric, None) or
+    (None, error response).
+    """
+    metric = request.form.get("metric", "cosine")
+    if metric not in SIMILARITY_METRICS:
+        return None, (
+            jsonify(
+                {
+                    "error": f"Unknown metric '{metric}'",
+                    "metrics": list(SIMILARITY_METRICS),
+                }
+            ),
+            HTTPStatus.BAD_REQUEST,
+        )
+    return metric, None
+
+
+def parse_paper_upload():
+    """
+    Validates the upload form shared by the paper analysis endpoints.
+    Returns (filename, bytes, metric, None) or (None, None, None, error response).
+    """
+    if "file" not in request.files:
+        error = jsonify({"error": "No file part"}), HTTPStatus.BAD_REQUEST
+        return None, None, None, error
+
+    file = request.files["file"]
+    if file.filename == "":
+        error = jsonify({"error": "No selected file"}), HTTPStatus.BAD_REQUEST
+        return None, None, None, error
+
+    metric, error = parse_similarity_metric()
+    if error:
+        return None, None, None, error
+
+    bytes_data = file.read(PAPER_MAX_BYTES + 1)
+    if len(bytes_data) > PAPER_MAX_BYTES:
+        error = (
+            jsonify({"error": f"File larger than {PAPER_MAX_BYTES} bytes"}),
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        )
+        return None, None, None, error
+
+    return file.filename, bytes_data, metric, None
+
+
+# Caps on how much of an upload is extracted; larger files are rejected and
+# PDF pages past the cap are ignored
+PAPER_MAX_BYTES = int(os.environ.get("PAPER_MAX_BYTES", 50 * 1024 * 1024))
+PAPER_MAX_PAGES = int(os.environ.get("PAPER_MAX_PAGES", 300))
+PDF_EXTRACT_WORKERS = int(os.environ.get("PDF_EXTRACT_WORKERS", 4))
+# Smallest page range worth shipping a PDF to another process for
+PDF_MIN_PAGES_PER_TASK = 8
+_paper_pool: ProcessPoolExecutor | None = None
+
+
+def ignore_shutdown_signals():
+    """
+    Initializer of the process pools. Pool processes are forked from a server
+    process and would inherit its SIGTERM handler, so a signal sent to the
+    whole process group would fail the task in flight. They are shut down by
+    their owner instead.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def get_paper_pool() -> ProcessPoolExecutor:
+    global _paper_pool
+    if _paper_pool is None:
+        _paper_pool = ProcessPoolExecutor(
+            max_workers=max(PDF_EXTRACT_WORKERS, 1), initializer=ignore_shutdown_signals
+        )
+    return _paper_pool
+
+
+def extract_pdf_pages(bytes_data: bytes, start: int, stop: int) -> list[str]:
+    """
+    Extracts the text of pages [start, stop) of a PDF. Runs inside the paper
+    pool, so every call opens its own reader.
+    """
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(io.BytesIO(bytes_data))
+    pages = []
+    for p in reader.pages[start:stop]:
+        try:
+            pages.append(p.extract_text() or "")
+        except Exception:
+            pages.append("")
+    return pages
+
+
+def extract_paper_text(bytes_data: bytes, workers: int = 1) -> str:
+    """
+    Extracts the text of an uploaded paper (PDF or text of unknown encoding).
+    With workers > 1, longer PDFs are split into at most that many page
+    ranges, each extracted in the paper pool.
+    """
+    # Prefer treating PDFs with a PDF parser; otherwise try UTF-8 then fall back
+    if bytes_data[:4] == b"%PDF":
+        # PDF file — try to extract text using PyPDF2 if available
+        try:
+            from PyPDF2 import PdfReader
+        except Exception:
+            PdfReader = None
+
+        if PdfReader is not None:
+            num_pages = min(
+                len(PdfReader(io.BytesIO(bytes_data)).pages), PAPER_MAX_PAGES
+            )
+            # One range per worker, since every task gets its own copy of the
+            # file and parses it again
+            tasks = min(workers, -(-num_pages // PDF_MIN_PAGES_PER_TASK))
+            bounds = [num_pages * i // max(tasks, 1) for i in range(tasks + 1)]
+            starts, stops = bounds[:-1], bounds[1:]
+
+            if tasks > 1:
+                chunks = get_paper_pool().map(
+                    extract_pdf_pages, [bytes_data] * len(starts), starts, stops
+                )
+            else:
+                chunks = [extract_pdf_pages(bytes_data, 0, num_pages)]
+            return "\n".join(page for chunk in chunks for page in chunk)
+
+        # PyPDF2 not installed — fall back to a tolerant text decode
+        return bytes_data.decode("latin-1", errors="replace")
+
+    # Try decode as UTF-8, then fallback to latin-1 with replacement
+    try:
+        return bytes_data.decode("utf-8")
+    except UnicodeDecodeError:
+        return bytes_data.decode("latin-1", errors="replace")
+
+
+UPLOAD_CACHE_MAX_BYTES = 32 * 1024 * 1024
+UPLOAD_CACHE_MAX_DISK_BYTES = int(
+    os.environ.get("UPLOAD_CACHE_MAX_DISK_BYTES", 512 * 1024 * 1024)
+)
+
+# Extracted text, tokens and analyses of uploads, keyed by SHA-256 of the bytes
+upload_cache = ArtifactCache(
+    UPLOAD_CACHE_MAX_BYTES, max_disk_bytes=UPLOAD_CACHE_MAX_DISK_BYTES
+)
+
+
+def upload_digest(bytes_data: bytes) -> str:
+    return hashlib.sha256(bytes_data).hexdigest()
+
+
+def get_upload_stage(digest: str, stage: str) -> Any | None:
+    """
+    Returns the cached text or tokens of an upload. They only depend on the
+    file, so they are kept across changes to the models.
+    """
+    return upload_cache.get(f"uploads/{digest}/{stage}.pkl", depends_on_sources=False)
+
+
+def put_upload_stage(digest: str, stage: str, value: Any):
+    upload_cache.put(f"uploads/{digest}/{stage}.pkl", value, depends_on_sources=False)
+
+
+def upload_tokens(digest: str, bytes_data: bytes, workers: int = 1) -> list[str]:
+    """
+    Returns the preprocessed tokens of an upload, extracting and
+    preprocessing it only if neither its tokens nor its text are cached.
+    """
+    if (tokens := get_upload_stage(digest, "tokens")) is None:
+        if (content := get_upload_stage(digest, "text")) is None:
+            content = extract_paper_text(bytes_data, workers=workers)
+            put_upload_stage(digest, "text", content)
+        tokens = preprocess_text(content)
+        put_upload_stage(digest, "tokens", tokens)
+    return tokens
+
+
+def upload_analysis_path(digest: str, metric: str) -> str:
+    return f"uploads/{digest}/analysis-{metric}.pkl"
+
+
+def with_filename(analysis: dict, filename: str) -> dict:
+    """
+    Returns a cached analysis relabelled with the name of the current upload.
+    """
+    return {
+        **analysis,
+        "preprocessing_outputs": {
+            **analysis["preprocessing_outputs"],
+            "filename": filename,
+        },
+    }
+
+
+def analyze_paper_group(
+    group_name: str, processed_text: list[str], metric: str
+) -> tuple[list[dict], list[dict]]:
+    """
+    Scores a preprocessed paper against one year group: returns its top 3
+    topics and the 5 most similar documents of the group.
+    """
+    model, num_topics, _ = all_topics[group_name]
+
+    # Convert processed text to bag of words
+    bow = model.id2word.doc2bow(processed_text)
+
+    if not bow:
+        return [], []
+
+    # Get topic distribution for uploaded document
+    doc_topics = model.get_document_topics(bow)
+
+    if not doc_topics:
+        return [], []
+
+    # Convert sparse topic distribution to dense vector
+    uploaded_vec = np.zeros(num_topics, dtype=np.float32)
+    for tid, prob in doc_topics:
+        uploaded_vec[tid] = prob
+
+    # Find similar documents through the group's nearest-document index
+    rows, scores = topic_indexes[group_name].search(
+        topic_matrices[group_name], uploaded_vec[None, :], 5, metric
+    )[0]
+
+    return paper_group_results(group_name, uploaded_vec, rows, scores)
+
+
+def paper_group_results(
+    group_name: str, uploaded_vec: np.ndarray, rows: np.ndarray, scores: np.ndarray
+) -> tuple[list[dict], list[dict]]:
+    """
+    Formats the top 3 topics of a paper's topic vector and its most similar
+    documents, given as df rows with their scores, best first.
+    """
+    model, _, df = all_topics[group_name]
+    topic_similarities = []
+    similar_documents = []
+
+    # Get top 3 topics for this document
+    for topic_id in top_k_indices(uploaded_vec, 3).tolist():
+        probability = uploaded_vec[topic_id]
+        if probability <= 0:
+            continue
+
+        # Get keywords for this topic
+        topic_words = model.show_topic(topic_id, topn=5)
+        keywords = [word for word, _ in topic_words]
+
+        topic_similarities.append(
+            {
+                "year_group": group_name,
+                "topic_id": topic_id,
+                "probability": float(probability),
+                "keywords": keywords,
+                "label": f"Topic {topic_id + 1}: {', '.join(keywords[:3])}",
+            }
+        )
+
+    # Top 5 from this year group
+    for pos, score in zip(rows.tolist(), scores.tolist()):
+        row = df.iloc[pos]
+
+        similar_documents.append(
+            {
+                "title": row.get("title", "Unknown"),
+                "authors": group_authors[group_name].names_of(pos),
+                "year": group_name,
+                "similarity": float(score),
+            }
+        )
+
+    return topic_similarities, similar_documents
+
+
+def preprocessing_outputs(filename: str, processed_text: list[str]) -> dict:
+    return {
+        "filename": filename,
+        "word_count": len(processed_text),
+        "unique_words": len(set(processed_text)),
+        "sample_words": processed_text[:20],
+    }
+
+
+def paper_groups(group_results: list[tuple[list[dict], list[dict]]]) -> dict:
+    """
+    Keys per-group results (in all_topics order) by year group.
+    """
+    return {
+        group_name: {"topic_similarity": topics, "similar_documents": documents}
+        for group_name, (topics, documents) in zip(all_topics, group_results)
+    }
+
+
+def combine_paper_analysis(
+    preprocessing: dict, group_results: list[tuple[list[dict], list[dict]]]
+) -> dict:
+    """
+    Merges per-group results into the paper analysis payload.
+    """
+    all_topic_similarities = [t for topics, _ in group_results for t in topics]
+    all_similar_documents = [d for _, documents in group_results for d in documents]
+
+    # Sort all similar documents by similarity and return top 10
+    all_similar_documents.sort(key=lambda x: x["similarity"], reverse=True)
+
+    # Sort topic similarities by probability
+    all_topic_similarities.sort(key=lambda x: x["probability"], reverse=True)
+
+    return {
+        "preprocessing_outputs": preprocessing,
+        "topic_similarity": all_topic_similarities[:10],
+        "similar_documents": all_similar_documents[:10],
+    }
+
+
+@app.route("/api/paper-analysis", methods=["POST"])
+@requires("topic_indexes", "authors")
+def paper_analysis():
+    """
+    Analyzes an uploaded paper and finds similar documents and topics.
+    The optional "metric" form field selects "cosine" (default) or "hellinger".
+    """
+    filename, bytes_data, metric, error = parse_paper_upload()
+    if error:
+        return error
+
+    try:
+        # Repeat uploads are answered straight from the upload cache
+        digest = upload_digest(bytes_data)
+        if (
+            cached := upload_cache.get(upload_analysis_path(digest, metric))
+        ) is not None:
+            return jsonify(with_filename(cached["analysis"], filename))
+
+        # Read the uploaded file (handle binary PDFs and text with unknown encoding)
+        processed_text = upload_tokens(digest, bytes_data, workers=PDF_EXTRACT_WORKERS)
+
+        # Find topic similarities and similar documents across all year groups
+        group_results = [
+            analyze_paper_group(group_name, processed_text, metric)
+            for group_name in all_topics
+        ]
+        analysis = combine_paper_analysis(
+            preprocessing_outputs(filename, processed_text), group_results
+        )
+        upload_cache.put(
+            upload_analysis_path(digest, metric),
+            {
+                "groups": paper_groups(group_results),
+                "analysis": analysis,
+            },
+        )
+
+        return jsonify(analysis)
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+PAPER_BATCH_MAX_DOCUMENTS = 50
+PAPER_BATCH_MAX_BYTES = int(os.environ.get("PAPER_BATCH_MAX_BYTES", 200 * 1024 * 1024))
+
+
+def extract_and_preprocess(bytes_data: bytes) -> tuple[str, list[str]]:
     """
-    GET endpoint to return either a full (limited) author graph or a subgraph
-    for a specific author when ?author_name= is provided.
+    Extracts and preprocesses one uploaded paper. Runs inside the paper pool.
     """
-    author_name = request.args.get("author_name", "")
+    content = extract_paper_text(bytes_data)
+    return content, preprocess_text(content)
 
-    # If an author is requested, mirror the POST behavior (return subgraph)
-    if author_name:
-        nodes = []
-        links = []
-        added_nodes = set()
-        added_links = set()
 
-        if author_name not in all_authors:
-            return (
-                jsonify({"nodes": [], "links": [], "message": "Author not found"}),
-                200,
+def paper_batch_entries(file):
+    """
+    Yields (filename, bytes, None) for an upload, or for every member of a zip
+    upload, and (filename, None, error) for entries that are skipped.
+    Reads are bounded by PAPER_MAX_BYTES; zip archives are read from the
+    spooled upload rather than copied into memory.
+    """
+    head = file.stream.read(4)
+    file.stream.seek(0)
+
+    if head != b"PK\x03\x04":
+        data = file.read(PAPER_MAX_BYTES + 1)
+        if len(data) > PAPER_MAX_BYTES:
+            yield file.filename, None, "File too large"
+        else:
+            yield file.filename, data, None
+        return
+
+    try:
+        with zipfile.ZipFile(file.stream) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or info.filename.startswith("__MACOSX/"):
+                    continue
+                # Members never decompress past their declared size
+                if info.file_size > PAPER_MAX_BYTES:
+                    yield info.filename, None, "File too large"
+                    continue
+                yield info.filename, archive.read(info), None
+    except (zipfile.BadZipFile, RuntimeError, NotImplementedError) as e:
+        # Corrupt, encrypted or unsupported compression
+        yield file.filename, None, str(e)
+
+
+def read_paper_batch(files):
+    """
+    Reads the uploaded files, expanding zip archives into their members.
+    Stops as soon as the batch passes PAPER_BATCH_MAX_DOCUMENTS documents or
+    PAPER_BATCH_MAX_BYTES bytes in total.
+    Returns (documents, skipped, None) with the (filename, bytes) documents and
+    the skipped entries, or (None, None, error response).
+    """
+    documents = []
+    skipped = []
+    total_bytes = 0
+
+    for file in files:
+        if file.filename == "":
+            continue
+
+        for filename, data, error in paper_batch_entries(file):
+            if error:
+                skipped.append({"filename": filename, "error": error})
+                continue
+
+            total_bytes += len(data)
+            if (
+                len(documents) == PAPER_BATCH_MAX_DOCUMENTS
+                or total_bytes > PAPER_BATCH_MAX_BYTES
+            ):
+                error = (
+                    jsonify(
+                        {
+                            "error": f"At most {PAPER_BATCH_MAX_DOCUMENTS} documents"
+                            f" and {PAPER_BATCH_MAX_BYTES} bytes per batch"
+                        }
+                    ),
+                    HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                )
+                return None, None, error
+            documents.append((filename, data))
+
+    return documents, skipped, None
+
+
+def analyze_paper_batch(token_lists: list[list[str]], metric: str):
+    """
+    Scores many preprocessed papers against every year group with one batched
+    inference pass per model. Returns the per-paper group results and the
+    paper x paper similarity, averaged over the groups both papers map into.
+    """
+    count = len(token_lists)
+    group_results = [[] for _ in range(count)]
+    cross_sum = np.zeros((count, count), dtype=np.float64)
+    cross_groups = np.zeros((count, count), dtype=np.int32)
+
+    for group_name, (model, num_topics, _) in all_topics.items():
+        vecs = infer_topic_matrix(model, num_topics, token_lists)
+        # Drop the same low-probability topics get_document_topics would
+        vecs[vecs < max(model.minimum_probability, 1e-8)] = 0
+        present = np.flatnonzero(vecs.any(axis=1))
+        if len(present) == 0:
+            continue
+
+        similar = topic_indexes[group_name].search(
+            topic_matrices[group_name], vecs[present], 5, metric
+        )
+        for doc, (rows, scores) in zip(present.tolist(), similar):
+            group_results[doc].append(
+                paper_group_results(group_name, vecs[doc], rows, scores)
             )
 
-        # Calculate paper counts for all authors first
-        author_paper_counts = {}
-        for group_name, (model, num_topics, df) in all_topics.items():
-            if "authors" in df.columns:
-                for _, doc in df.iterrows():
-                    authors_list = parse_authors_field(doc.get("authors"))
-                    for author in authors_list:
-                        author_paper_counts[author] = (
-                            author_paper_counts.get(author, 0) + 1
-                        )
+        pairs = np.ix_(present, present)
+        cross_sum[pairs] += topic_similarity_matrix(
+            vecs[present], vecs[present], metric
+        )
+        cross_groups[pairs] += 1
 
-        nodes.append(
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cross = np.nan_to_num(cross_sum / cross_groups)
+    return group_results, cross
+
+
+@app.route("/api/paper-analysis/batch", methods=["POST"])
+@requires("topic_indexes", "authors")
+def paper_analysis_batch():
+    """
+    Analyzes several papers in one request. Takes any number of "files" (or
+    "file") uploads, zip archives are expanded, and the optional "metric".
+    Returns the single-paper analysis of every document plus their pairwise
+    similarity.
+    """
+    files = request.files.getlist("files") + request.files.getlist("file")
+    if not files:
+        return jsonify({"error": "No file part"}), HTTPStatus.BAD_REQUEST
+
+    metric, error = parse_similarity_metric()
+    if error:
+        return error
+
+    documents, skipped, error = read_paper_batch(files)
+    if error:
+        return error
+    if not documents:
+        return (
+            jsonify({"error": "No readable documents", "skipped": skipped}),
+            HTTPStatus.BAD_REQUEST,
+        )
+
+    try:
+        filenames = [filename for filename, _ in documents]
+        digests = [upload_digest(data) for _, data in documents]
+        token_lists = [get_upload_stage(digest, "tokens") for digest in digests]
+
+        # Only documents missing from the upload cache are extracted
+        missing = [i for i, tokens in enumerate(token_lists) if tokens is None]
+        contents = [documents[i][1] for i in missing]
+        if len(contents) <= 1:
+            extracted = [extract_and_preprocess(data) for data in contents]
+        else:
+            extracted = get_paper_pool().map(extract_and_preprocess, contents)
+        for i, (content, tokens) in zip(missing, extracted):
+            put_upload_stage(digests[i], "text", content)
+            put_upload_stage(digests[i], "tokens", tokens)
+            token_lists[i] = tokens
+
+        group_results, cross = analyze_paper_batch(token_lists, metric)
+
+        return jsonify(
             {
-                "id": author_name,
-                "group": "author",
-                "paper_count": author_paper_counts.get(author_name, 0),
+                "documents": [
+                    combine_paper_analysis(
+                        preprocessing_outputs(filename, tokens), results
+                    )
+                    for filename, tokens, results in zip(
+                        filenames, token_lists, group_results
+                    )
+                ],
+                "cross_similarity": {
+                    "filenames": filenames,
+                    "matrix": cross.round(6).tolist(),
+                },
+                "skipped": skipped,
             }
         )
-        added_nodes.add(author_name)
 
-        neighbors = list(all_authors.neighbors(author_name))
+    except Exception as e:
+        return jsonify({"error": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
 
-        for co_author in neighbors[:50]:
-            if co_author not in added_nodes:
-                weight = all_authors[author_name][co_author].get("weight", 1)
-                nodes.append(
-                    {
-                        "id": co_author,
-                        "group": "co-author",
-                        "weight": weight,
-                        "paper_count": author_paper_counts.get(co_author, 0),
-                    }
-                )
-                added_nodes.add(co_author)
 
-            link_key = tuple(sorted([author_name, co_author]))
-            if link_key not in added_links:
-                weight = all_authors[author_name][co_author].get("weight", 1)
-                links.append(
-                    {"source": author_name, "target": co_author, "value": weight}
+PAPER_ANALYSIS_WORKERS = int(os.environ.get("PAPER_ANALYSIS_WORKERS", 2))
+# Finished jobs beyond this many are forgotten, oldest first
+PAPER_ANALYSIS_MAX_JOBS = 256
+# Published job files untouched for this long are deleted, including those
+# left behind by a restart or by another worker
+PAPER_ANALYSIS_JOB_TTL = int(os.environ.get("PAPER_ANALYSIS_JOB_TTL", 24 * 3600))
+
+
+class PaperAnalysisJob:
+    """
+    One queued paper analysis. Per-group results are published as each year
+    group finishes so clients can render them before the whole job is done.
+    Every change is also written to pickles/paper_jobs/, so any worker of the
+    production server can answer polls for the job.
+    """
+
+    def __init__(self, filename: str, metric: str):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.metric = metric
+        self.lock = threading.Lock()
+        self.status = "queued"
+        self.progress = {"step": 0, "total": 0, "message": "Queued"}
+        self.preprocessing: dict | None = None
+        self.groups: dict[str, dict] = {}
+        self.result: dict | None = None
+        self.error: str | None = None
+        self.submitted_at = time.time()
+        self.finished_at: float | None = None
+
+    def run(self, bytes_data: bytes):
+        total = len(all_topics) + 1
+        try:
+            digest = upload_digest(bytes_data)
+            path = upload_analysis_path(digest, self.metric)
+            if (cached := upload_cache.get(path)) is not None:
+                result = with_filename(cached["analysis"], self.filename)
+                with self.lock:
+                    self.preprocessing = result["preprocessing_outputs"]
+                    self.groups = cached["groups"]
+            else:
+                result = self._analyze(digest, bytes_data, total)
+                upload_cache.put(
+                    path, {"groups": dict(self.groups), "analysis": result}
                 )
-                added_links.add(link_key)
+        except Exception as e:
+            with self.lock:
+                self.status = "failed"
+                self.error = str(e)
+                self.finished_at = time.time()
+            self.publish()
+            return
 
-        # papers
-        for group_name, (model, num_topics, df) in all_topics.items():
-            if "authors" in df.columns and "title" in df.columns:
-                for _, doc in df.iterrows():
-                    authors_list = parse_authors_field(doc.get("authors"))
-                    if author_name in authors_list:
-                        paper_id = doc.get("title", "Unknown")
-                        if paper_id not in added_nodes:
-                            nodes.append(
-                                {"id": paper_id, "group": "paper", "year": group_name}
-                            )
-                            added_nodes.add(paper_id)
-
-                        link_key = (author_name, paper_id)
-                        if link_key not in added_links:
-                            links.append(
-                                {"source": author_name, "target": paper_id, "value": 1}
-                            )
-                            added_links.add(link_key)
-
-                        for co_author in authors_list:
-                            if co_author != author_name and co_author in added_nodes:
-                                link_key = (co_author, paper_id)
-                                if link_key not in added_links:
-                                    links.append(
-                                        {
-                                            "source": co_author,
-                                            "target": paper_id,
-                                            "value": 1,
-                                        }
-                                    )
-                                    added_links.add(link_key)
+        with self.lock:
+            self.status = "done"
+            self.result = result
+            self.progress = {"step": total, "total": total, "message": "Done"}
+            self.finished_at = time.time()
+        self.publish()
+
+    def _analyze(self, digest: str, bytes_data: bytes, total: int) -> dict:
+        self._report(1, total, "Extracting text", status="running")
+        processed_text = upload_tokens(digest, bytes_data, workers=PDF_EXTRACT_WORKERS)
+        with self.lock:
+            self.preprocessing = preprocessing_outputs(self.filename, processed_text)
+
+        group_results = []
+        for step, group_name in enumerate(all_topics, start=2):
+            self._report(step, total, f"Analyzing {group_name}")
+            topics, documents = analyze_paper_group(
+                group_name, processed_text, self.metric
+            )
+            group_results.append((topics, documents))
+            with self.lock:
+                self.groups[group_name] = {
+                    "topic_similarity": topics,
+                    "similar_documents": documents,
+                }
+            self.publish()
+
+        return combine_paper_analysis(self.preprocessing, group_results)
+
+    def _report(self, step: int, total: int, message: str, status: str | None = None):
+        with self.lock:
+            self.progress = {"step": step, "total": total, "message": message}
+            if status:
+                self.status = status
+        self.publish()
+
+    def publish(self):
+        save_pickle(paper_analysis_job_path(self.id), self.snapshot())
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "job_id": self.id,
+                "filename": self.filename,
+                "metric": self.metric,
+                "status": self.status,
+                "progress": dict(self.progress),
+                "error": self.error,
+                "preprocessing_outputs": self.preprocessing,
+                "groups": dict(self.groups),
+                "result": self.result,
+                "submitted_at": self.submitted_at,
+                "finished_at": self.finished_at,
+            }
 
-        # Calculate statistics
-        statistics = {
-            "total_co_authors": len([n for n in nodes if n["group"] == "co-author"]),
-            "total_papers": len([n for n in nodes if n["group"] == "paper"]),
-            "total_connections": len(links),
-        }
 
-        response = {"nodes": nodes, "links": links, "statistics": statistics}
-        return jsonify(response)
+def paper_analysis_job_path(job_id: str) -> str:
+    return f"paper_jobs/{job_id}.pkl"
 
-    # Otherwise return a limited full graph summary (cap sizes)
-    nodes = []
-    links = []
-    # compute weighted degree for node sizing
-    try:
-        weighted_degrees = {
-            n: int(all_authors.degree(n, weight="weight") or 0)
-            for n in all_authors.nodes()
-        }
-    except Exception:
-        weighted_degrees = {n: 0 for n in all_authors.nodes()}
 
-    # Calculate paper count for each author
-    author_paper_counts = {}
-    for group_name, (model, num_topics, df) in all_topics.items():
-        if "authors" in df.columns:
-            for _, doc in df.iterrows():
-                authors_list = parse_authors_field(doc.get("authors"))
-                for author in authors_list:
-                    author_paper_counts[author] = author_paper_counts.get(author, 0) + 1
+paper_analysis_jobs: OrderedDict[str, PaperAnalysisJob] = OrderedDict()
+paper_analysis_jobs_lock = threading.Lock()
+_paper_analysis_pool: ThreadPoolExecutor | None = None
 
-    # limit nodes to first 1000 and links to first 2000 to keep payload reasonable
-    node_list = list(all_authors.nodes())[:1000]
-    node_set = set(node_list)  # Create a set for O(1) lookup
 
-    for n in node_list:
-        nodes.append(
-            {
-                "id": n,
-                "group": "author",
-                "weight": weighted_degrees.get(n, 0),
-                "paper_count": author_paper_counts.get(n, 0),
-            }
+def get_paper_analysis_pool() -> ThreadPoolExecutor:
+    global _paper_analysis_pool
+    if _paper_analysis_pool is None:
+        _paper_analysis_pool = ThreadPoolExecutor(
+            max_workers=PAPER_ANALYSIS_WORKERS, thread_name_prefix="paper-analysis"
         )
+    return _paper_analysis_pool
 
-    # Only include edges where BOTH nodes are in our selected node set
-    for u, v, data in all_authors.edges(data=True):
-        if u in node_set and v in node_set:
-            links.append({"source": u, "target": v, "value": data.get("weight", 1)})
-            if len(links) >= 2000:  # Still limit total links
-                break
 
-    return jsonify(
-        {
-            "nodes": nodes,
-            "links": links,
-            "statistics": {"nodes": len(nodes), "links": len(links)},
+def expire_paper_analysis_jobs():
+    """
+    Deletes published job files older than PAPER_ANALYSIS_JOB_TTL. Jobs of
+    this process that are still queued or running are kept.
+    """
+    with paper_analysis_jobs_lock:
+        active = {
+            job_id
+            for job_id, job in paper_analysis_jobs.items()
+            if job.status not in ("done", "failed")
         }
-    )
 
+    cutoff = time.time() - PAPER_ANALYSIS_JOB_TTL
+    for file in (Path("pickles") / "paper_jobs").glob("*.pkl"):
+        try:
+            if file.stem not in active and file.stat().st_mtime < cutoff:
+                file.unlink()
+        except OSError:  # expired by another worker meanwhile
+            continue
 
-@app.route("/api/network-statistics")
-def network_statistics():
-    if (to_return := load_pickle("network_statistics.pkl")) is None:
-        nodes = all_authors.number_of_nodes()
-        edges = all_authors.number_of_edges()
-
-        # Calculate number of communities using Louvain algorithm
-        undirected_graph = all_authors.to_undirected()
-        communities_generator = nx.community.louvain_communities(undirected_graph)
-        communities = len(list(communities_generator))
-
-        # Calculate average degree
-        degrees = [degree for _, degree in all_authors.degree()]
-        average_degree = sum(degrees) / len(degrees) if degrees else 0
-        to_return = {
-            "nodes": nodes,
-            "edges": edges,
-            "communities": communities,
-            "average_degree": average_degree,
-        }
 
-        save_pickle("network_statistics.pkl", to_return)
+def submit_paper_analysis(filename: str, bytes_data: bytes, metric: str):
+    expire_paper_analysis_jobs()
+    job = PaperAnalysisJob(filename, metric)
 
-    return jsonify(to_return)
+    with paper_analysis_jobs_lock:
+        paper_analysis_jobs[job.id] = job
+        # Forget the oldest finished jobs once over the limit
+        for job_id in list(paper_analysis_jobs):
+            if len(paper_analysis_jobs) <= PAPER_ANALYSIS_MAX_JOBS:
+                break
+            if paper_analysis_jobs[job_id].status in ("done", "failed"):
+                del paper_analysis_jobs[job_id]
+                (Path("pickles") / paper_analysis_job_path(job_id)).unlink(
+                    missing_ok=True
+                )
 
+    job.publish()
+    get_paper_analysis_pool().submit(job.run, bytes_data)
+    return job
 
-@app.route("/api/paper-analysis", methods=["POST"])
-def paper_analysis():
+
+@app.route("/api/paper-analysis/jobs", methods=["POST"])
+@requires("topic_indexes", "authors")
+def paper_analysis_submit():
     """
-    Analyzes an uploaded paper and finds similar documents and topics.
+    Queues an uploaded paper for analysis and returns the job id immediately.
+    Takes the same form fields as /api/paper-analysis.
     """
-    if "file" not in request.files:
-        return jsonify({"error": "No file part"}), HTTPStatus.BAD_REQUEST
+    filename, bytes_data, metric, error = parse_paper_upload()
+    if error:
+        return error
+
+    job = submit_paper_analysis(filename, bytes_data, metric)
+    return (
+        jsonify({**job.snapshot(), "status_url": f"/api/paper-analysis/jobs/{job.id}"}),
+        HTTPStatus.ACCEPTED,
+    )
 
-    file = request.files["file"]
-    if file.filename == "":
-        return jsonify({"error": "No selected file"}), HTTPStatus.BAD_REQUEST
 
-    try:
-        # Read the uploaded file (handle binary PDFs and text with unknown encoding)
-        bytes_data = file.read()
-        content = ""
+@app.route("/api/paper-analysis/jobs/<job_id>")
+def paper_analysis_job(job_id: str):
+    """
+    Returns the status of a paper analysis job. "groups" holds the results of
+    every year group finished so far; "result" is set once the job is done.
+    """
+    with paper_analysis_jobs_lock:
+        job = paper_analysis_jobs.get(job_id)
+    if job is not None:
+        return jsonify(job.snapshot())
+
+    # Submitted to another worker of the production server
+    if re.fullmatch(r"[0-9a-f]{32}", job_id) and (
+        snapshot := load_pickle(paper_analysis_job_path(job_id))
+    ):
+        return jsonify(snapshot)
+
+    return jsonify({"error": f"Unknown job '{job_id}'"}), HTTPStatus.NOT_FOUND
+
+
+WORDCLOUD_CACHE_MAX_BYTES = 64 * 1024 * 1024
+WORDCLOUD_CACHE_MAX_DISK_BYTES = int(
+    os.environ.get("WORDCLOUD_CACHE_MAX_DISK_BYTES", 256 * 1024 * 1024)
+)
+WORDCLOUD_DEFAULTS = {"dpi": 150, "cols": 3, "topn": 50}
+WORDCLOUD_LIMITS = {"dpi": (50, 300), "cols": (1, 6), "topn": (5, 200)}
+
+# Rendered PNGs are cached separately so they can't evict the JSON artifacts
+wordcloud_cache = ArtifactCache(
+    WORDCLOUD_CACHE_MAX_BYTES, max_disk_bytes=WORDCLOUD_CACHE_MAX_DISK_BYTES
+)
+# One render batch at a time so concurrent misses don't duplicate the work
+wordcloud_render_lock = threading.Lock()
+WORDCLOUD_RENDER_WORKERS = int(
+    os.environ.get("WORDCLOUD_RENDER_WORKERS", os.cpu_count() or 1)
+)
+_wordcloud_pool: ProcessPoolExecutor | None = None
+
+
+def get_wordcloud_pool() -> ProcessPoolExecutor:
+    global _wordcloud_pool
+    if _wordcloud_pool is None:
+        _wordcloud_pool = ProcessPoolExecutor(
+            max_workers=max(WORDCLOUD_RENDER_WORKERS, 1),
+            initializer=ignore_shutdown_signals,
+        )
+    return _wordcloud_pool
 
-        # Prefer treating PDFs with a PDF parser; otherwise try UTF-8 then fall back
-        try:
-            if bytes_data[:4] == b"%PDF":
-                # PDF file — try to extract text using PyPDF2 if available
-                from io import BytesIO
 
-                try:
-                    from PyPDF2 import PdfReader
-                except Exception:
-                    PdfReader = None
-
-                if PdfReader is not None:
-                    reader = PdfReader(BytesIO(bytes_data))
-                    pages = []
-                    for p in reader.pages:
-                        try:
-                            pages.append(p.extract_text() or "")
-                        except Exception:
-                            pages.append("")
-                    content = "\n".join(pages)
-                else:
-                    # PyPDF2 not installed — fall back to a tolerant text decode
-                    content = bytes_data.decode("latin-1", errors="replace")
-            else:
-                # Try decode as UTF-8, then fallback to latin-1 with replacement
-                try:
-                    content = bytes_data.decode("utf-8")
-                except UnicodeDecodeError:
-                    content = bytes_data.decode("latin-1", errors="replace")
-        except Exception:
-            # Let outer exception handler catch and report
-            raise
+def render_topic_wordcloud(word_freq: dict[str, float], scale: float) -> bytes:
+    """
+    Renders a single topic's word cloud to PNG. Runs inside the render pool.
+    """
+    from wordcloud import WordCloud
 
-        processed_text = preprocess_text(content)
+    wordcloud = WordCloud(
+        width=400,
+        height=300,
+        scale=scale,
+        background_color="white",
+        colormap="viridis",
+        relative_scaling=0.5,
+        min_font_size=8,
+    ).generate_from_frequencies(word_freq)
 
-        # Find topic similarities and similar documents across all year groups
-        all_topic_similarities = []
-        all_similar_documents = []
+    buf = io.BytesIO()
+    wordcloud.to_image().save(buf, format="PNG")
+    return buf.getvalue()
 
-        for group_name, (model, num_topics, df) in all_topics.items():
-            # Convert processed text to bag of words
-            bow = model.id2word.doc2bow(processed_text)
 
-            if not bow:
-                continue
+def wordcloud_font(size: int) -> "ImageFont.FreeTypeFont":
+    from PIL import ImageFont
+    from wordcloud.wordcloud import FONT_PATH
 
-            # Get topic distribution for uploaded document
-            doc_topics = model.get_document_topics(bow)
+    return ImageFont.truetype(FONT_PATH, size)
 
-            if not doc_topics:
-                continue
 
-            # Get top 3 topics for this document
-            top_topics = sorted(doc_topics, key=lambda x: x[1], reverse=True)[:3]
+def compose_wordcloud_grid(
+    year_group: str, images: list[bytes], labels: list[str], cols: int, scale: float
+) -> bytes:
+    """
+    Pastes per-topic word clouds into one grid PNG with a title over each
+    cloud and a heading over the grid.
+    """
+    from PIL import Image, ImageDraw
+
+    clouds = [Image.open(io.BytesIO(png)).convert("RGB") for png in images]
+    cell_width, cell_height = clouds[0].size if clouds else (1, 1)
+    margin = int(16 * scale)
+    title_height = int(28 * scale)
+    heading_height = int(48 * scale)
+
+    rows = max((len(clouds) + cols - 1) // cols, 1)  # Ceiling division
+    grid = Image.new(
+        "RGB",
+        (
+            cols * (cell_width + margin) + margin,
+            heading_height + rows * (title_height + cell_height + margin),
+        ),
+        "white",
+    )
+    draw = ImageDraw.Draw(grid)
+
+    heading_font = wordcloud_font(int(22 * scale))
+    draw.text(
+        (grid.width // 2, heading_height // 2),
+        f"Topic Word Clouds - {year_group}",
+        fill="black",
+        font=heading_font,
+        anchor="mm",
+    )
 
-            for topic_id, probability in top_topics:
-                # Get keywords for this topic
-                topic_words = model.show_topic(topic_id, topn=5)
-                keywords = [word for word, _ in topic_words]
+    title_font = wordcloud_font(int(13 * scale))
+    for i, (cloud, label) in enumerate(zip(clouds, labels)):
+        row, col = divmod(i, cols)
+        x = margin + col * (cell_width + margin)
+        y = heading_height + row * (title_height + cell_height + margin)
+        draw.text(
+            (x + cell_width // 2, y + title_height // 2),
+            label,
+            fill="black",
+            font=title_font,
+            anchor="mm",
+        )
+        grid.paste(cloud, (x, y + title_height))
 
-                all_topic_similarities.append(
-                    {
-                        "year_group": group_name,
-                        "topic_id": topic_id,
-                        "probability": float(probability),
-                        "keywords": keywords,
-                        "label": f"Topic {topic_id + 1}: {', '.join(keywords[:3])}",
-                    }
-                )
+    buf = io.BytesIO()
+    grid.save(buf, format="PNG")
+    return buf.getvalue()
 
-            # Find similar documents using topic similarity
-            if "processed_summary" in df.columns:
-                similarities = []
 
-                for idx, row in df.iterrows():
-                    if not row.get("processed_summary"):
-                        continue
+def cached_png(png: bytes) -> dict:
+    return {
+        "png": png,
+        "etag": hashlib.sha1(png).hexdigest(),
+        "last_modified": time.time(),
+    }
 
-                    # Get topics for corpus document
-                    corpus_bow = model.id2word.doc2bow(row["processed_summary"])
-                    corpus_topics = model.get_document_topics(corpus_bow)
 
-                    if not corpus_topics:
-                        continue
+def get_topic_wordclouds(
+    year_group: str, topic_ids: list[int], dpi: int, topn: int
+) -> list[dict]:
+    """
+    Returns the cached {"png", "etag", "last_modified"} of each topic's word
+    cloud, rendering all missing topics in parallel in the render pool.
+    """
+    paths = [
+        f"wordclouds/{year_group}-topic{topic_id}-{dpi}-{topn}.pkl"
+        for topic_id in topic_ids
+    ]
+    rendered = [wordcloud_cache.get(path) for path in paths]
+    if all(item is not None for item in rendered):
+        return rendered
 
-                    # Calculate similarity using Hellinger distance
-                    from scipy.spatial.distance import cosine
+    with wordcloud_render_lock:
+        # Another request may have rendered some of them while we waited
+        rendered = [wordcloud_cache.get(path) for path in paths]
+        missing = [i for i, item in enumerate(rendered) if item is None]
 
-                    # Convert sparse topic distributions to dense vectors
-                    uploaded_vec = [0.0] * num_topics
-                    for tid, prob in doc_topics:
-                        uploaded_vec[tid] = prob
+        lda_model = all_topics[year_group][0]
+        word_freqs = [
+            {
+                word: float(weight)
+                for word, weight in lda_model.show_topic(topic_ids[i], topn=topn)
+            }
+            for i in missing
+        ]
+        scales = [dpi / 100] * len(missing)
 
-                    corpus_vec = [0.0] * num_topics
-                    for tid, prob in corpus_topics:
-                        corpus_vec[tid] = prob
+        if len(missing) > 1:
+            pngs = get_wordcloud_pool().map(render_topic_wordcloud, word_freqs, scales)
+        else:
+            pngs = map(render_topic_wordcloud, word_freqs, scales)
 
-                    # Calculate cosine similarity
-                    try:
-                        similarity = 1 - cosine(uploaded_vec, corpus_vec)
-                    except:
-                        similarity = 0.0
+        for i, png in zip(missing, pngs):
+            rendered[i] = cached_png(png)
+            wordcloud_cache.put(paths[i], rendered[i])
 
-                    similarities.append(
-                        {"index": idx, "similarity": similarity, "row": row}
-                    )
+    return rendered
 
-                # Sort by similarity and get top 5 from this year group
-                similarities.sort(key=lambda x: x["similarity"], reverse=True)
 
-                for sim_doc in similarities[:5]:
-                    row = sim_doc["row"]
-                    try:
-                        authors = parse_authors_field(row.get("authors"))
-                    except:
-                        authors = ["Unknown"]
+def get_wordcloud(year_group: str, dpi: int, cols: int, topn: int) -> dict:
+    """
+    Returns {"png", "etag", "last_modified"} for a year group's word cloud grid,
+    composing it from the per-topic clouds and caching it (in memory and in
+    pickles/wordclouds/) on a miss.
+    """
+    path = f"wordclouds/{year_group}-{dpi}-{cols}-{topn}.pkl"
+    if (rendered := wordcloud_cache.get(path)) is not None:
+        return rendered
 
-                    all_similar_documents.append(
-                        {
-                            "title": row.get("title", "Unknown"),
-                            "authors": authors,
-                            "year": group_name,
-                            "similarity": float(sim_doc["similarity"]),
-                        }
-                    )
+    print(f"Rendering word clouds for year group: {year_group}")
 
-        # Sort all similar documents by similarity and return top 10
-        all_similar_documents.sort(key=lambda x: x["similarity"], reverse=True)
+    lda_model, num_topics, _ = all_topics[year_group]
+    topics = get_topic_wordclouds(year_group, list(range(num_topics)), dpi, topn)
 
-        # Sort topic similarities by probability
-        all_topic_similarities.sort(key=lambda x: x["probability"], reverse=True)
+    # Get top 3 words of each topic for its title
+    labels = [
+        f"Topic {topic_id + 1}: "
+        + ", ".join(word for word, _ in lda_model.show_topic(topic_id, topn=3))
+        for topic_id in range(num_topics)
+    ]
 
-        analysis = {
-            "preprocessing_outputs": {
-                "filename": file.filename,
-                "word_count": len(processed_text),
-                "unique_words": len(set(processed_text)),
-                "sample_words": processed_text[:20],
-            },
-            "topic_similarity": all_topic_similarities[:10],
-            "similar_documents": all_similar_documents[:10],
-        }
+    rendered = cached_png(
+        compose_wordcloud_grid(
+            year_group, [topic["png"] for topic in topics], labels, cols, dpi / 100
+        )
+    )
+    wordcloud_cache.put(path, rendered)
+    return rendered
 
-        return jsonify(analysis)
 
-    except Exception as e:
-        return jsonify({"error": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+def prewarm_wordclouds():
+    """
+    Renders the default word clouds of every year group ahead of requests.
+    """
+    readiness.ensure("topics")
+    for year_group in list(all_topics.keys()):
+        try:
+            get_wordcloud(year_group, **WORDCLOUD_DEFAULTS)
+        except Exception as e:
+            print(f"Could not prewarm word cloud for {year_group}: {e}")
+
+
+def wordcloud_params(names: tuple[str, ...]) -> dict[str, int]:
+    params = {}
+    for name in names:
+        low, high = WORDCLOUD_LIMITS[name]
+        value = request.args.get(name, WORDCLOUD_DEFAULTS[name], type=int)
+        params[name] = min(max(value, low), high)
+    return params
+
+
+def send_cached_png(rendered: dict):
+    return send_file(
+        io.BytesIO(rendered["png"]),
+        mimetype="image/png",
+        etag=rendered["etag"],
+        last_modified=rendered["last_modified"],
+        conditional=True,
+        max_age=0,
+    )
 
 
 @app.route("/api/corpus-wordcloud/<year_group>", methods=["GET"])
+@requires("topics")
 def corpus_wordcloud(year_group):
     """
     Generates a word cloud from the entire corpus.
-    Returns the PNG file.
+    Returns the PNG file, with ETag/Last-Modified for conditional requests.
+    Optional query parameters: dpi, cols and topn (words per topic).
     """
 
     try:
-        lda_model: LdaMulticore | None = None
-        num_topics: int | None = None
-        for group, (model, topic_count, df) in all_topics.items():
-            if group == year_group:
-                lda_model = model
-                num_topics = topic_count
-                break
+        if year_group not in all_topics:
+            return {"error": f"Group {year_group} not found"}, HTTPStatus.NOT_FOUND
+
+        params = wordcloud_params(("dpi", "cols", "topn"))
+        return send_cached_png(get_wordcloud(year_group, **params))
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
 
-        if lda_model is None or num_topics is None:
+
+@app.route("/api/corpus-wordcloud/<year_group>/<int:topic_id>", methods=["GET"])
+@requires("topics")
+def corpus_topic_wordcloud(year_group, topic_id):
+    """
+    Returns the PNG word cloud of a single topic, so topics can be lazy-loaded.
+    Optional query parameters: dpi and topn (words in the cloud).
+    """
+
+    try:
+        if year_group not in all_topics:
             return {"error": f"Group {year_group} not found"}, HTTPStatus.NOT_FOUND
 
-        # Collect all words from all documents across all year groups
-        print(f"\n{'='*70}")
-        print(f"Word Clouds for Year Group: {year_group}")
-        print(f"{'='*70}\n")
+        if topic_id >= all_topics.num_topics(year_group):
+            return (
+                {"error": f"Topic {topic_id} not found in group {year_group}"},
+                HTTPStatus.NOT_FOUND,
+            )
+
+        params = wordcloud_params(("dpi", "topn"))
+        (rendered,) = get_topic_wordclouds(year_group, [topic_id], **params)
+        return send_cached_png(rendered)
 
-        # Calculate grid size for subplots
-        cols = 3
-        rows = (num_topics + cols - 1) // cols  # Ceiling division
+    except Exception as e:
+        return jsonify({"error": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def warm_up():
+    """
+    Loads every stage ahead of requests, then starts the background jobs.
+    """
+    expire_paper_analysis_jobs()
+    try:
+        readiness.ensure(*readiness.stages)
+    except Exception as e:
+        print(f"Warm-up failed: {e}")
+        return
+    print(f"Startup breakdown: import {IMPORT_SECONDS:.2f}s, {readiness.breakdown()}")
+    prewarm_wordclouds()
+    refresh_network_statistics()
 
-        fig, axes = plt.subplots(rows, cols, figsize=(15, 5 * rows))
-        fig.suptitle(
-            f"Topic Word Clouds - {year_group}", fontsize=16, fontweight="bold"
+
+SERVER_HOST = os.environ.get("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.environ.get("SERVER_PORT", 5000))
+SERVER_WORKERS = int(os.environ.get("SERVER_WORKERS", os.cpu_count() or 1))
+SERVER_THREADS = int(os.environ.get("SERVER_THREADS", 8))
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    Werkzeug server that handles connections on a fixed pool of threads
+    instead of a new thread per connection.
+    """
+
+    multithread = True
+
+    def __init__(self, *args, threads: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="request"
         )
 
-        # Flatten axes array for easier iteration
-        if rows == 1 and cols == 1:
-            axes = [axes]
-        elif rows == 1 or cols == 1:
-            axes = axes.flatten()
-        else:
-            axes = axes.flatten()
+    def process_request(self, request, client_address):
+        self.pool.submit(self.process_request_thread, request, client_address)
 
-        for topic_id in range(num_topics):
-            ax = axes[topic_id]
-
-            # Get top 50 words for this topic
-            topic_words = lda_model.show_topic(topic_id, topn=50)
-
-            # Create word frequency dictionary
-            word_freq = {word: float(weight) for word, weight in topic_words}
-
-            # Generate word cloud
-            wordcloud = WordCloud(
-                width=400,
-                height=300,
-                background_color="white",
-                colormap="viridis",
-                relative_scaling=0.5,
-                min_font_size=8,
-            ).generate_from_frequencies(word_freq)
-
-            # Display word cloud
-            ax.imshow(wordcloud, interpolation="bilinear")
-            ax.axis("off")
-
-            # Get top 3 words for title
-            top_words = ", ".join([word for word, _ in topic_words[:3]])
-            ax.set_title(
-                f"Topic {topic_id + 1}: {top_words}", fontsize=10, fontweight="bold"
-            )
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
 
-        # Hide any unused subplots
-        for idx in range(num_topics, len(axes)):
-            axes[idx].axis("off")
 
-        # Adjust layout and save the figure with all subplots
-        plt.tight_layout()
+class PooledRequestHandler(WSGIRequestHandler):
+    # Close idle keep-alive connections so they don't hold a pool thread
+    timeout = 15
 
-        # Save to file
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        buf.seek(0)
 
-        return send_file(buf, mimetype="image/png")
+def run_worker(sock: socket.socket, host: str, port: int, threads: int, slot: int):
+    """
+    Serves requests on the inherited listening socket until SIGTERM, then
+    lets the requests in flight finish.
+    """
+
+    def stop(signum, frame):
+        # Only the first signal stops the server; a repeat (say from the parent
+        # after a process group signal) must not cut the drain short
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    # Ctrl-C reaches the whole process group; the parent stops the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    server = PooledWSGIServer(
+        host, port, app, PooledRequestHandler, fd=sock.fileno(), threads=threads
+    )
+    print(f"Worker {os.getpid()} serving with {threads} threads")
+
+    # One worker prewarms; the background tasks are exclusive across workers
+    # anyway and their results land in the disk cache
+    if slot == 0:
+        threading.Thread(
+            target=lambda: (prewarm_wordclouds(), refresh_network_statistics()),
+            name="warm-up",
+            daemon=True,
+        ).start()
+
+    try:
+        server.serve_forever()
+    except SystemExit:
+        pass
+    finally:
+        server.pool.shutdown(wait=True)
+        server.server_close()
+        # The worker leaves through os._exit, which skips the executors' own
+        # cleanup, so stop the pool processes here or they outlive it
+        for pool in (_paper_pool, _wordcloud_pool):
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
 
-    except Exception as e:
-        return jsonify({"error": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
 
+def share_worker_budgets(workers: int):
+    """
+    Divides the per-process budgets between the workers. Whatever the parent
+    has loaded stays shared, only the room left for each worker's own entries
+    shrinks, and the process pools are split so the server as a whole keeps
+    the configured sizes.
+    """
+    global PDF_EXTRACT_WORKERS, WORDCLOUD_RENDER_WORKERS
+
+    for cache in (artifact_cache, wordcloud_cache, upload_cache, all_topics):
+        room = max(cache.max_bytes - cache.total_bytes, 0)
+        cache.max_bytes = cache.total_bytes + room // workers
+
+    PDF_EXTRACT_WORKERS = max(PDF_EXTRACT_WORKERS // workers, 1)
+    WORDCLOUD_RENDER_WORKERS = max(WORDCLOUD_RENDER_WORKERS // workers, 1)
+
+
+def serve(host: str, port: int, workers: int, threads: int):
+    """
+    Production entry point. Loads every stage once in this process, then forks
+    workers that accept on one shared socket. The workers share the loaded
+    data copy-on-write; the large arrays are memory-mapped, so touching them
+    doesn't copy pages into each worker. Crashed workers are restarted.
+    Background jobs and process pools start in the workers, never here, so
+    no threads are running at the fork.
+    """
+    readiness.ensure(*readiness.stages)
+    print(f"Startup breakdown: import {IMPORT_SECONDS:.2f}s, {readiness.breakdown()}")
+
+    # Derived data every worker reads, built once here instead of per worker
+    corpus_document_columns(get_corpus_documents())
+    expire_paper_analysis_jobs()
+    share_worker_budgets(workers)
+
+    # Move everything loaded so far out of the collector's reach, so its
+    # bookkeeping writes don't unshare those pages in every worker
+    gc.collect()
+    gc.freeze()
+
+    sock = socket.create_server((host, port), backlog=1024)
+    print(f"Listening on {host}:{port} with {workers} workers")
+
+    children: dict[int, int] = {}
+    stopping = False
+
+    def spawn(slot: int):
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                run_worker(sock, host, port, threads, slot)
+            except BaseException as e:
+                print(f"Worker {os.getpid()} failed: {e}")
+                status = 1
+            finally:
+                os._exit(status)
+        children[pid] = slot
+
+    def stop(signum, frame):
+        nonlocal stopping
+        if stopping:
+            return
+        stopping = True
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+
+    for slot in range(workers):
+        spawn(slot)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        slot = children.pop(pid, None)
+        if slot is not None and not stopping:
+            code = os.waitstatus_to_exitcode(status)
+            print(f"Worker {pid} exited with status {code}, restarting")
+            spawn(slot)
+
+    sock.close()
+
+
+IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED
+print(f"Imported api in {IMPORT_SECONDS:.2f}s")
 
 if __name__ == "__main__":
     print("Starting the Flask application!")
 
     # Download NLTK data if needed
+    import nltk
+
     try:
         nltk.data.find("corpora/stopwords")
         nltk.data.find("tokenizers/punkt")
@@ -984,12 +4023,11 @@ if __name__ == "__main__":
         nltk.download("punkt_tab", quiet=True)
         nltk.download("wordnet", quiet=True)
 
-    print("Loading dataset...")
-    load_dataset()
-    print("Loading topics...")
-    load_topics()
-    print("Loading author graph...")
-    load_author_graph()
+    if "--production" in sys.argv[1:]:
+        serve(SERVER_HOST, SERVER_PORT, SERVER_WORKERS, SERVER_THREADS)
+    else:
+        # Requests load what they need on demand while the warm-up runs
+        threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
 
-    print("Starting flask host.")
-    app.run(host="0.0.0.0", port=5000, debug=True)
+        print("Starting flask host.")
+        app.run(host="0.0.0.0", port=5000, debug=True)